@@ -1,21 +1,35 @@
 import asyncio
 import logging
-import requests.exceptions
+from datetime import timedelta
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
 
 from .const import (
     CONF_DEFAULT_TEMPERATURE,
     CONF_DEFAULT_SCAN_INTERVAL,
+    CONF_FAST_SCAN_INTERVAL,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_OFFLINE_SCAN_INTERVAL,
+    CONF_OPTIMISTIC_WRITES,
     CONF_PASSWORD,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_OFFLINE_SCAN_INTERVAL,
+    DEFAULT_OPTIMISTIC_WRITES,
+    DISCOVERY_INTERVAL,
     CONF_USERNAME,
     DOMAIN,
     PLATFORMS,
+    SIGNAL_STOVES_ADDED,
     STARTUP_MESSAGE,
 )
-from .core import RikaFirenetCoordinator
+from .core import RikaFirenetCoordinator, async_remove_entry_stores
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -23,6 +37,7 @@ CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
 async def async_setup(hass: HomeAssistant, config: dict):
     _LOGGER.info("setup_platform()")
+    async_setup_services(hass)
     return True
 
 
@@ -35,21 +50,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     username = entry.data.get(CONF_USERNAME)
     password = entry.data.get(CONF_PASSWORD)
-    default_temperature = int(entry.options.get(CONF_DEFAULT_TEMPERATURE, 21))
-    default_scan_interval = int(entry.options.get(CONF_DEFAULT_SCAN_INTERVAL, 15))
 
     coordinator = RikaFirenetCoordinator(
-        hass, username, password, default_temperature, default_scan_interval
+        hass,
+        username,
+        password,
+        *_get_coordinator_options(entry),
+        entry_id=entry.entry_id,
     )
 
     try:
-        await hass.async_add_executor_job(coordinator.setup)
-        await coordinator.async_refresh()
+        # Stoves restored from the last known snapshot are polled in the background once set up
+        restored = await coordinator.setup()
+        if not restored:
+            await coordinator.async_refresh()
 
-        if not coordinator.last_update_success:
-            raise ConfigEntryNotReady
+            if not coordinator.last_update_success:
+                raise ConfigEntryNotReady
 
-    except requests.exceptions.Timeout as ex:
+    except asyncio.TimeoutError as ex:
         _LOGGER.warning("Timeout during Rika Firenet setup: %s", ex)
         raise ConfigEntryNotReady from ex
 
@@ -60,31 +79,89 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     # Filter platforms based on options and forward the setup.
-    enabled_platforms = [
-        platform for platform in PLATFORMS if entry.options.get(platform, True)
-    ]
-    await hass.config_entries.async_forward_entry_setups(entry, enabled_platforms)
+    coordinator.platforms = _get_enabled_platforms(entry)
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
 
-    entry.add_update_listener(_async_options_updated)
+    if restored:
+        # Cancelled if the entry is unloaded first
+        entry.async_create_background_task(
+            hass, _async_refresh_restored(hass, entry, coordinator), f"{DOMAIN}_first_refresh"
+        )
+
+    async def _async_periodic_rediscovery(now):
+        await _async_rediscover_stoves(hass, entry, coordinator)
+
+    entry.async_on_unload(
+        async_track_time_interval(hass, _async_periodic_rediscovery, timedelta(seconds=DISCOVERY_INTERVAL))
+    )
+
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
     return True
 
 
+def _get_coordinator_options(entry: ConfigEntry):
+    """Coordinator settings from the entry options, in RikaFirenetCoordinator argument order."""
+    return (
+        int(entry.options.get(CONF_DEFAULT_TEMPERATURE, 21)),
+        int(entry.options.get(CONF_DEFAULT_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)),
+        int(entry.options.get(CONF_FAST_SCAN_INTERVAL, DEFAULT_FAST_SCAN_INTERVAL)),
+        int(entry.options.get(CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL)),
+        int(entry.options.get(CONF_OFFLINE_SCAN_INTERVAL, DEFAULT_OFFLINE_SCAN_INTERVAL)),
+        bool(entry.options.get(CONF_OPTIMISTIC_WRITES, DEFAULT_OPTIMISTIC_WRITES)),
+    )
+
+
+def _get_enabled_platforms(entry: ConfigEntry):
+    return [platform for platform in PLATFORMS if entry.options.get(platform, True)]
+
+
+async def _async_refresh_restored(hass: HomeAssistant, entry: ConfigEntry, coordinator: RikaFirenetCoordinator):
+    """First poll of stoves restored from the snapshot, then a check of the cached stove list."""
+    await coordinator.async_refresh()
+    await _async_rediscover_stoves(hass, entry, coordinator)
+
+
+async def _async_rediscover_stoves(hass: HomeAssistant, entry: ConfigEntry, coordinator: RikaFirenetCoordinator):
+    """Add entities for new stoves and remove the devices of stoves gone from the account."""
+    added, removed = await coordinator.async_rediscover_stoves()
+    if added:
+        async_dispatcher_send(hass, SIGNAL_STOVES_ADDED.format(entry_id=entry.entry_id), added)
+    if removed:
+        device_registry = dr.async_get(hass)
+        for stove_id in removed:
+            device = device_registry.async_get_device(identifiers={(DOMAIN, str(stove_id))})
+            if device is not None:
+                # Removing the device also removes its entities
+                device_registry.async_update_device(device.id, remove_config_entry_id=entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Handle removal of an entry."""
     _LOGGER.info("Unloading entry: %s", entry.entry_id)
-    unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    unloaded = await hass.config_entries.async_unload_platforms(entry, coordinator.platforms)
     if unloaded:
         hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
     return unloaded
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Remove data persisted for an entry."""
+    await async_remove_entry_stores(hass, entry.entry_id)
+
+
 async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry):
     """Handle options update."""
     _LOGGER.info("Options updated for entry: %s", entry.entry_id)
-    await async_reload_entry(hass, entry)
+    coordinator: RikaFirenetCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if _get_enabled_platforms(entry) != coordinator.platforms:
+        # Platforms were enabled or disabled, their entities have to be set up again
+        await async_reload_entry(hass, entry)
+        return
+    await coordinator.async_apply_options(*_get_coordinator_options(entry))
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
\ No newline at end of file
+    await hass.config_entries.async_reload(entry.entry_id)
\ No newline at end of file
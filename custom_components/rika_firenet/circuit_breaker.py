@@ -0,0 +1,59 @@
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop polling the Firenet cloud after repeated failures.
+
+    closed: requests flow normally, failures are counted.
+    open: no requests until reset_timeout has elapsed.
+    half_open: a single probe decides whether to close again or to re-open
+    with a doubled timeout (capped at max_reset_timeout).
+    """
+
+    def __init__(self, failure_threshold, reset_timeout, max_reset_timeout):
+        self._failure_threshold = failure_threshold
+        self._base_reset_timeout = reset_timeout
+        self._max_reset_timeout = max_reset_timeout
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self.state = STATE_CLOSED
+
+    def allow_request(self):
+        """Return True if a request may be made, moving from open to half_open once the timeout has elapsed."""
+        if self.state == STATE_OPEN:
+            if time.monotonic() - self._opened_at < self._reset_timeout:
+                return False
+            _LOGGER.debug("Circuit breaker half open, probing Rika Firenet")
+            self.state = STATE_HALF_OPEN
+        return True
+
+    def record_success(self):
+        if self.state != STATE_CLOSED:
+            _LOGGER.info("Rika Firenet is reachable again, circuit breaker closed")
+        self.state = STATE_CLOSED
+        self._failures = 0
+        self._reset_timeout = self._base_reset_timeout
+
+    def record_failure(self):
+        self._failures += 1
+        if self.state == STATE_HALF_OPEN:
+            self._reset_timeout = min(self._reset_timeout * 2, self._max_reset_timeout)
+            self._open()
+        elif self.state == STATE_CLOSED and self._failures >= self._failure_threshold:
+            self._open()
+
+    def _open(self):
+        _LOGGER.warning(
+            f"Rika Firenet unreachable after {self._failures} failed updates, "
+            f"pausing requests for {self._reset_timeout}s"
+        )
+        self.state = STATE_OPEN
+        self._opened_at = time.monotonic()
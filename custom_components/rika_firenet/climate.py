@@ -1,5 +1,4 @@
 import logging
-import time
 from datetime import datetime, timedelta
 
 from homeassistant.components.climate import (
@@ -15,8 +14,8 @@ from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import callback
 
 from .const import DOMAIN, SUPPORT_PRESET
-from .core import RikaFirenetCoordinator
-from .entity import RikaFirenetEntity
+from .core import RikaFirenetCoordinator, get_state_fields
+from .entity import RikaFirenetEntity, async_setup_stove_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,18 +31,26 @@ async def async_setup_entry(hass, entry, async_add_entities):
     _LOGGER.info("setting up platform climate")
     coordinator: RikaFirenetCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    stove_entities = []
+    def build_entities(stoves):
+        stove_entities = []
+        # Create stove sensors
+        for stove in stoves:
+            stove_entities.append(RikaFirenetStoveClimate(entry, stove, coordinator))
+        return stove_entities
 
-    # Create stove sensors
-    for stove in coordinator.get_stoves():
-        stove_entities.append(RikaFirenetStoveClimate(entry, stove, coordinator))
-
-    if stove_entities:
-        async_add_entities(stove_entities, True)
+    async_setup_stove_entities(hass, entry, async_add_entities, build_entities)
 
 
 class RikaFirenetStoveClimate(RikaFirenetEntity, ClimateEntity):
     _enable_turn_on_off_backwards_compatibility = False
+    _state_fields = get_state_fields(
+        "get_status_picture",
+        "get_room_temperature",
+        "get_preset_mode",
+        "get_room_thermostat",
+        "get_hvac_mode",
+        "get_hvac_action",
+    )
     def __init__(self, config_entry, stove, coordinator):
         super().__init__(config_entry, stove, coordinator)
         self._attr_translation_key = "stove_climate"  # Key used for translation
@@ -127,12 +134,12 @@ class RikaFirenetStoveClimate(RikaFirenetEntity, ClimateEntity):
         if not self._stove.is_stove_on():
             _LOGGER.info(f"Stove {self.name} is off, turning it on before setting temperature")
             self._stove.set_stove_on_off(True)
-            await self.coordinator.async_request_refresh()
-            # Petit délai pour laisser le poêle se mettre en route
-            await self.hass.async_add_executor_job(time.sleep, 2)
-            
+            # Attendre que le poêle confirme la mise en route avant d'envoyer la température
+            if not await self.coordinator.async_apply_controls(self._stove):
+                _LOGGER.warning(f"Stove {self.name} did not confirm it was turned on")
+
         self._stove.set_stove_temperature(temperature)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_request_controls_update(self._stove)
 
     async def async_set_hvac_mode(self, hvac_mode):
         """Set HVAC mode with rate limiting and retry logic."""
@@ -145,9 +152,6 @@ class RikaFirenetStoveClimate(RikaFirenetEntity, ClimateEntity):
         self._last_mode_change = now
 
         try:
-            # Attendre un court instant pour assurer la stabilité de la transition
-            await self.hass.async_add_executor_job(time.sleep, 1)
-            
             current_mode = self._stove.get_hvac_mode()
             if current_mode == hvac_mode:
                 _LOGGER.debug(f"Stove {self.name} already in {hvac_mode} mode")
@@ -155,21 +159,10 @@ class RikaFirenetStoveClimate(RikaFirenetEntity, ClimateEntity):
 
             self._stove.set_hvac_mode(str(hvac_mode))
             
-            # Premier rafraîchissement pour envoyer la commande
-            await self.coordinator.async_request_refresh()
-            
-            # Attendre et vérifier que le changement a été appliqué
-            await self.hass.async_add_executor_job(time.sleep, 2)
-            
-            # Deuxième rafraîchissement pour confirmer le changement
-            await self.coordinator.async_request_refresh()
-            
-            # Vérifier si le changement a été appliqué
-            if self._stove.get_hvac_mode() != hvac_mode:
+            # Envoi de la commande, terminé dès que le poêle confirme le changement
+            if not await self.coordinator.async_apply_controls(self._stove):
                 _LOGGER.warning(f"Mode change to {hvac_mode} may not have been applied for {self.name}")
-                # Un dernier essai
-                await self.coordinator.async_request_refresh()
-                
+
         except Exception as e:
             _LOGGER.error(f"Error setting HVAC mode for {self.name}: {e}")
             # Réinitialiser le timer en cas d'erreur pour permettre une nouvelle tentative
@@ -192,15 +185,8 @@ class RikaFirenetStoveClimate(RikaFirenetEntity, ClimateEntity):
 
             # Appliquer le nouveau mode
             self._stove.set_preset_mode(preset_mode)
-            await self.coordinator.async_request_refresh()
-
-            # Vérifier que le changement a été appliqué
-            await self.hass.async_add_executor_job(time.sleep, 1)
-            await self.coordinator.async_request_refresh()
-
-            if self._stove.get_preset_mode() != preset_mode:
+            if not await self.coordinator.async_apply_controls(self._stove):
                 _LOGGER.warning(f"Preset mode change to {preset_mode} may not have been applied for {self.name}")
-                await self.coordinator.async_request_refresh()
         
         except Exception as e:
             _LOGGER.error(f"Error setting preset mode for {self.name}: {e}")
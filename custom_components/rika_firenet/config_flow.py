@@ -6,7 +6,17 @@ from homeassistant.core import callback
 from .const import (
     CONF_DEFAULT_TEMPERATURE,
     CONF_DEFAULT_SCAN_INTERVAL,
+    CONF_FAST_SCAN_INTERVAL,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_OFFLINE_SCAN_INTERVAL,
+    CONF_OPTIMISTIC_WRITES,
     CONF_PASSWORD,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_OFFLINE_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    DEFAULT_OPTIMISTIC_WRITES,
     CONF_USERNAME,
     DOMAIN,
     PLATFORMS,
@@ -16,6 +26,9 @@ from .core import RikaFirenetCoordinator
 _LOGGER = logging.getLogger(__name__)
 
 
+SCAN_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL))
+
+
 class RikaFirenetFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_CLOUD_POLL
@@ -69,8 +82,8 @@ class RikaFirenetFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         """Return true if credentials is valid."""
         try:
             # Use the static method for a clean, isolated authentication test.
-            return await self.hass.async_add_executor_job(
-                RikaFirenetCoordinator.test_authentication, username, password
+            return await RikaFirenetCoordinator.test_authentication(
+                self.hass, username, password
             )
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("test_credentials_exception")
@@ -102,8 +115,24 @@ class RikaFirenetOptionsFlowHandler(config_entries.OptionsFlow):
             ): int,
             vol.Required(
                 CONF_DEFAULT_SCAN_INTERVAL,
-                default=self.options.get(CONF_DEFAULT_SCAN_INTERVAL, 15),
-            ): int,
+                default=self.options.get(CONF_DEFAULT_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            ): SCAN_INTERVAL_VALIDATOR,
+            vol.Required(
+                CONF_FAST_SCAN_INTERVAL,
+                default=self.options.get(CONF_FAST_SCAN_INTERVAL, DEFAULT_FAST_SCAN_INTERVAL),
+            ): SCAN_INTERVAL_VALIDATOR,
+            vol.Required(
+                CONF_IDLE_SCAN_INTERVAL,
+                default=self.options.get(CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL),
+            ): SCAN_INTERVAL_VALIDATOR,
+            vol.Required(
+                CONF_OFFLINE_SCAN_INTERVAL,
+                default=self.options.get(CONF_OFFLINE_SCAN_INTERVAL, DEFAULT_OFFLINE_SCAN_INTERVAL),
+            ): SCAN_INTERVAL_VALIDATOR,
+            vol.Required(
+                CONF_OPTIMISTIC_WRITES,
+                default=self.options.get(CONF_OPTIMISTIC_WRITES, DEFAULT_OPTIMISTIC_WRITES),
+            ): bool,
         }
         schema_properties.update(
             {
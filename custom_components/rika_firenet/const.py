@@ -7,6 +7,10 @@ CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 CONF_DEFAULT_TEMPERATURE = "defaultTemperature"
 CONF_DEFAULT_SCAN_INTERVAL  = "defaultScanInterval"
+CONF_FAST_SCAN_INTERVAL = "fastScanInterval"
+CONF_IDLE_SCAN_INTERVAL = "idleScanInterval"
+CONF_OFFLINE_SCAN_INTERVAL = "offlineScanInterval"
+CONF_OPTIMISTIC_WRITES = "optimisticWrites"
 DATA = "data"
 UPDATE_TRACK = "update_track"
 
@@ -23,14 +27,72 @@ SUPPORT_PRESET = [PRESET_NONE, PRESET_COMFORT]
 
 # API Endpoints
 BASE_URL = "https://www.rika-firenet.com"
-LOGIN_URL = f"{BASE_URL}/web/login"
-SUMMARY_URL = f"{BASE_URL}/web/summary"
-STATUS_URL = f"{BASE_URL}/api/client/{{stove_id}}/status"
-CONTROLS_URL = f"{BASE_URL}/api/client/{{stove_id}}/controls"
+LOGIN_PATH = "/web/login"
+SUMMARY_PATH = "/web/summary"
+STATUS_PATH = "/api/client/{stove_id}/status"
+CONTROLS_PATH = "/api/client/{stove_id}/controls"
+
+# HTTP timeouts (seconds)
+REQUEST_TIMEOUT = 10
+CONTROLS_REQUEST_TIMEOUT = 15
+
+# Update cycle
+MAX_CONCURRENT_STOVE_UPDATES = 4
+UPDATE_CYCLE_TIMEOUT = 40  # seconds, bounds a whole poll cycle
+STATUS_CACHE_TTL = 5  # seconds a status payload is reused instead of fetched again
+
+# Retries: exponential backoff with jitter, bounded per stove and per update cycle
+RETRY_BASE_DELAY = 2  # seconds
+RETRY_MAX_DELAY = 30  # seconds
+RETRY_BUDGET_PER_STOVE = 4  # retries per stove and update cycle
+
+# Circuit breaker: stop polling after repeated failed cycles, serve the last known state meanwhile
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3  # failed update cycles
+CIRCUIT_BREAKER_RESET_TIMEOUT = 60  # seconds before the first probe
+CIRCUIT_BREAKER_MAX_RESET_TIMEOUT = 900  # seconds
+STALE_STATE_MAX_AGE = 7200  # seconds a last known state may be served
+
+# Control writes made within this window are merged into a single POST
+CONTROLS_COALESCE_WINDOW_MS = 500
+# Seconds an entity command waits for the stove to confirm the requested controls
+CONTROLS_CONFIRM_TIMEOUT = 20
+# Apply accepted controls locally instead of fetching the status after each write
+DEFAULT_OPTIMISTIC_WRITES = True
+
+# Adaptive polling (seconds)
+DEFAULT_SCAN_INTERVAL = 15
+DEFAULT_FAST_SCAN_INTERVAL = 5
+DEFAULT_IDLE_SCAN_INTERVAL = 60
+DEFAULT_OFFLINE_SCAN_INTERVAL = 300
+MIN_SCAN_INTERVAL = 5  # lowest scan interval accepted in the options
+# statusMainState values that change quickly: ignition, start up, clean, burn off
+FAST_POLL_MAIN_STATES = [2, 3, 5, 6]
 
 VERSION = "2.29.37"
 DOMAIN = "rika_firenet"
 
+# Storage
+STORAGE_VERSION = 1
+SESSION_STORAGE_KEY = f"{DOMAIN}.{{entry_id}}.session"
+# Stove list and last payload per stove, restored at startup before the first poll
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}.{{entry_id}}.snapshot"
+SNAPSHOT_SAVE_DELAY = 60  # seconds
+# Controls not accepted yet per stove, replayed after a restart
+COMMAND_QUEUE_STORAGE_KEY = f"{DOMAIN}.{{entry_id}}.command_queue"
+COMMAND_QUEUE_MAX_AGE = 3600  # seconds a queued control is still replayed
+# hass.data key of the stores of each config entry
+DATA_STORES = f"{DOMAIN}_stores"
+
+# Poll cycles and control writes kept for the diagnostics download
+CYCLE_TRACE_SIZE = 20
+
+# Background check of the stove list on the account
+DISCOVERY_INTERVAL = 6 * 3600  # seconds
+# Consecutive stove list checks a stove must be missing from before it is removed
+DISCOVERY_MISSES_BEFORE_REMOVAL = 3
+SIGNAL_STOVES_ADDED = f"{DOMAIN}_stoves_added_{{entry_id}}"
+SESSION_COOKIE = "connect.sid"
+
 UNIQUE_ID = "unique_id"
 
 DEFAULT_NAME = "RIKA"
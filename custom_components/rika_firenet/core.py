@@ -1,30 +1,162 @@
+import asyncio
+import codecs
+import contextlib
+import functools
 import logging
 import time
-from datetime import datetime, timedelta
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+from collections import namedtuple
+from datetime import timedelta
+from email.utils import parsedate_to_datetime
+from http.cookies import SimpleCookie
+from yarl import URL
 from homeassistant.components.climate.const import HVACAction, HVACMode, PRESET_COMFORT, PRESET_NONE
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 from .const import (
     DOMAIN,
-    LOGIN_URL,
-    SUMMARY_URL,
-    STATUS_URL,
-    CONTROLS_URL
+    BASE_URL,
+    LOGIN_PATH,
+    SUMMARY_PATH,
+    STATUS_PATH,
+    CONTROLS_PATH,
+    REQUEST_TIMEOUT,
+    CONTROLS_REQUEST_TIMEOUT,
+    MAX_CONCURRENT_STOVE_UPDATES,
+    UPDATE_CYCLE_TIMEOUT,
+    STATUS_CACHE_TTL,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_OFFLINE_SCAN_INTERVAL,
+    FAST_POLL_MAIN_STATES,
+    CONTROLS_COALESCE_WINDOW_MS,
+    CONTROLS_CONFIRM_TIMEOUT,
+    DEFAULT_OPTIMISTIC_WRITES,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    RETRY_BUDGET_PER_STOVE,
+    SESSION_COOKIE,
+    SESSION_STORAGE_KEY,
+    SNAPSHOT_STORAGE_KEY,
+    SNAPSHOT_SAVE_DELAY,
+    COMMAND_QUEUE_STORAGE_KEY,
+    COMMAND_QUEUE_MAX_AGE,
+    STORAGE_VERSION,
+    DATA_STORES,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RESET_TIMEOUT,
+    CIRCUIT_BREAKER_MAX_RESET_TIMEOUT,
+    STALE_STATE_MAX_AGE,
+    CYCLE_TRACE_SIZE,
+    DISCOVERY_MISSES_BEFORE_REMOVAL,
 )
+from .circuit_breaker import CircuitBreaker, STATE_HALF_OPEN, STATE_OPEN
+from .cycle_trace import CycleTracer
+from .discovery import StoveListParser, parse_stove_list_bs4
+from .retry import RetryScheduler
+from .stats import ENDPOINT_CONTROLS, ENDPOINT_LOGIN, ENDPOINT_STATUS, ENDPOINT_SUMMARY, RequestStats
 
 _LOGGER = logging.getLogger(__name__)
 
+_TIMEOUT = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+_CONTROLS_TIMEOUT = aiohttp.ClientTimeout(total=CONTROLS_REQUEST_TIMEOUT)
+
+_STORAGE_KEYS = (SESSION_STORAGE_KEY, SNAPSHOT_STORAGE_KEY, COMMAND_QUEUE_STORAGE_KEY)
+
+
+@callback
+def async_get_entry_stores(hass, entry_id):
+    """Returns the session, snapshot and command queue stores of a config entry.
+
+    The same Store objects serve every coordinator of the entry and its removal, so a
+    delayed save of a previous coordinator cannot write a file back after it.
+    """
+    stores = hass.data.setdefault(DATA_STORES, {})
+    if entry_id not in stores:
+        stores[entry_id] = tuple(
+            Store(hass, STORAGE_VERSION, key.format(entry_id=entry_id)) for key in _STORAGE_KEYS
+        )
+    return stores[entry_id]
+
+
+async def async_remove_entry_stores(hass, entry_id):
+    """Removes the files persisted for a config entry, cancelling their pending saves."""
+    for store in async_get_entry_stores(hass, entry_id):
+        await store.async_remove()
+    hass.data[DATA_STORES].pop(entry_id, None)
+
 class RikaFirenetCoordinator(DataUpdateCoordinator):
-    def __init__(self, hass, username, password, default_temperature, default_scan_interval):
+    def __init__(
+        self,
+        hass,
+        username,
+        password,
+        default_temperature,
+        default_scan_interval,
+        fast_scan_interval=DEFAULT_FAST_SCAN_INTERVAL,
+        idle_scan_interval=DEFAULT_IDLE_SCAN_INTERVAL,
+        offline_scan_interval=DEFAULT_OFFLINE_SCAN_INTERVAL,
+        optimistic_writes=DEFAULT_OPTIMISTIC_WRITES,
+        entry_id=None,
+        base_url=BASE_URL,
+    ):
         self.hass = hass
+        # base_url can point to a local stand-in server (tools/fake_firenet.py)
+        self._login_url = f"{base_url}{LOGIN_PATH}"
+        self._summary_url = f"{base_url}{SUMMARY_PATH}"
+        self._status_url = f"{base_url}{STATUS_PATH}"
+        self._controls_url = f"{base_url}{CONTROLS_PATH}"
         self._username = username
         self._password = password
-        self._default_temperature = int(default_temperature)
-        self._default_scan_interval = timedelta(seconds=default_scan_interval)
-        self._client = requests.session() # Keep a single session for all requests
+        self._set_options(
+            default_temperature,
+            default_scan_interval,
+            fast_scan_interval,
+            idle_scan_interval,
+            offline_scan_interval,
+            optimistic_writes,
+        )
+        # Dedicated aiohttp session (own cookie jar for connect.sid) on top of HA's shared connector
+        self._client = async_create_clientsession(hass)
+        self._login_lock = asyncio.Lock()
+        self._session_store, self._snapshot_store, self._command_queue_store = (
+            async_get_entry_stores(hass, entry_id) if entry_id else (None, None, None)
+        )
+        self._snapshot_save_due = None # time.monotonic() of the snapshot save already scheduled
+        # Controls not accepted yet per stove, in write order: {stove id: {key: (value, time.time() queued)}}
+        self._command_queue: dict[str, dict[str, tuple]] = {}
+        # Part of the queue loaded at startup and not replayed yet
+        self._commands_to_replay: dict[str, dict[str, tuple]] = {}
+        self._update_semaphore = asyncio.Semaphore(MAX_CONCURRENT_STOVE_UPDATES)
+        # Latest status payload (with its monotonic timestamp) and controls revision per stove
+        self._status_cache: dict[str, tuple[float, dict]] = {}
+        self._revisions: dict[str, int] = {}
+        # Control writes waiting for the end of their coalescing window
+        self._control_locks: dict[str, asyncio.Lock] = {}
+        self._control_flush_tasks: dict[str, asyncio.Task] = {}
+        self._control_waiters: dict[str, list[asyncio.Future]] = {}
+        # Control writes skipped per stove because every control already had its confirmed value
+        self._suppressed_writes: dict[str, int] = {}
+        # Commands waiting for a payload showing their controls: [controls, revision of their accepted write, future]
+        self._confirmation_waiters: dict[str, list[list]] = {}
         self._stoves: list[RikaFirenetStove] = [] # Type hinting for clarity
+        # Consecutive stove list checks each known stove was missing from
+        self._discovery_misses: dict[str, int] = {}
         self._number_fail = 0
+        self._request_stats = RequestStats()
+        self._tracer = CycleTracer(CYCLE_TRACE_SIZE)
+        self._retry_scheduler = RetryScheduler(RETRY_BASE_DELAY, RETRY_MAX_DELAY, RETRY_BUDGET_PER_STOVE)
+        self._circuit_breaker = CircuitBreaker(
+            CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_RESET_TIMEOUT, CIRCUIT_BREAKER_MAX_RESET_TIMEOUT
+        )
+        # time.monotonic() of the last payload or accepted write per stove
+        self._last_contact: dict[str, float] = {}
+        self._stale_stoves: set[str] = set()
+        # Snapshot fields changed per stove in the current listener notification
+        self._changed_fields: dict[str, set[str]] = {}
         self.platforms = []
 
         super().__init__(
@@ -35,69 +167,406 @@ class RikaFirenetCoordinator(DataUpdateCoordinator):
             update_interval=self._default_scan_interval
         )
 
+    def _set_options(
+        self,
+        default_temperature,
+        default_scan_interval,
+        fast_scan_interval,
+        idle_scan_interval,
+        offline_scan_interval,
+        optimistic_writes,
+    ):
+        self._default_temperature = int(default_temperature)
+        self._default_scan_interval = timedelta(seconds=default_scan_interval)
+        self._fast_scan_interval = timedelta(seconds=fast_scan_interval)
+        self._idle_scan_interval = timedelta(seconds=idle_scan_interval)
+        self._offline_scan_interval = timedelta(seconds=offline_scan_interval)
+        self._optimistic_writes = bool(optimistic_writes)
+
+    @callback
+    async def async_apply_options(
+        self,
+        default_temperature,
+        default_scan_interval,
+        fast_scan_interval=DEFAULT_FAST_SCAN_INTERVAL,
+        idle_scan_interval=DEFAULT_IDLE_SCAN_INTERVAL,
+        offline_scan_interval=DEFAULT_OFFLINE_SCAN_INTERVAL,
+        optimistic_writes=DEFAULT_OPTIMISTIC_WRITES,
+    ):
+        """Apply changed options to the running coordinator, keeping its session and stoves."""
+        self._set_options(
+            default_temperature,
+            default_scan_interval,
+            fast_scan_interval,
+            idle_scan_interval,
+            offline_scan_interval,
+            optimistic_writes,
+        )
+        update_interval = self._compute_update_interval()
+        if update_interval != self.update_interval:
+            _LOGGER.debug(f"Adjusting scan interval to {update_interval.total_seconds()}s")
+            self.update_interval = update_interval
+            # The refresh schedules the next poll with the new interval
+            await self.async_request_refresh()
+
     @staticmethod
-    def test_authentication(username, password):
+    async def test_authentication(hass, username, password, base_url=BASE_URL):
         """Test authentication with Rika Firenet credentials."""
         _LOGGER.debug("Testing Rika Firenet credentials.")
-        client = requests.session()
+        client = async_create_clientsession(hass, auto_cleanup=False)
         data = {'email': username, 'password': password}
         try:
-            response = client.post(LOGIN_URL, data, timeout=10)
-            response.raise_for_status()
-            if '/logout' not in response.text:
+            async with client.post(f"{base_url}{LOGIN_PATH}", data=data, timeout=_TIMEOUT) as response:
+                response.raise_for_status()
+                text = await response.text()
+            if '/logout' not in text:
                 _LOGGER.warning("Authentication test failed: '/logout' not in response.")
                 return False
             _LOGGER.debug("Authentication test successful.")
             return True
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             _LOGGER.error(f"Authentication test failed due to network error: {e}")
             return False
+        finally:
+            client.detach()
 
     async def async_update_data(self):
+        trace, token = self._tracer.start("poll")
+        result = "failed"
         try:
-            # The update method will now handle command sending logic
-            # and state synchronization.
-            await self.hass.async_add_executor_job(self.update)
-
-            # Build the data dictionary for HA entities
-            # This dictionary will be available via self.coordinator.data in entities
-            data = {}
             if not self._stoves:
                 _LOGGER.info("No stoves configured to update data for.")
+                result = "no stoves"
                 return {}
 
+            # Payloads reused from the status cache count as fresh for this cycle
+            cycle_start = time.monotonic()
+            fresh_since = cycle_start - STATUS_CACHE_TTL
+            if not self._circuit_breaker.allow_request():
+                _LOGGER.debug("Circuit breaker open, serving last known state")
+                trace.result = "circuit breaker open"
+            elif self._circuit_breaker.state == STATE_HALF_OPEN and not await self._async_probe():
+                self._circuit_breaker.record_failure()
+            else:
+                # The update method will now handle command sending logic
+                # and state synchronization.
+                await self.update()
+                if self._last_contact_since(fresh_since):
+                    self._circuit_breaker.record_success()
+                else:
+                    self._circuit_breaker.record_failure()
+
+            # Stoves without a fresh payload this cycle keep serving their last known state
+            self._stale_stoves = {
+                stove.get_id() for stove in self._stoves
+                if self._last_contact.get(stove.get_id(), 0) < fresh_since
+            }
+
+            # Build the data dictionary for HA entities
+            # This dictionary will be available via self.coordinator.data in entities
+            data = {}
             for stove in self._stoves:
                 stove_state = stove.get_state() # Utilise la méthode get_state()
-                if stove_state is not None: # Uses the get_state() method
-                    data[stove.get_id()] = stove_state
-                else:
+                if stove_state is None: # Uses the get_state() method
                     _LOGGER.warning(f"State for stove {stove.get_id()} is None after update. It will be unavailable in HA.")
+                elif cycle_start - self._last_contact.get(stove.get_id(), 0) > STALE_STATE_MAX_AGE:
+                    _LOGGER.warning(f"State for stove {stove.get_id()} is older than {STALE_STATE_MAX_AGE}s. It will be unavailable in HA.")
+                else:
+                    data[stove.get_id()] = stove_state
             
             if not data and self._stoves:
                 raise UpdateFailed("Failed to fetch data for any stove.")
 
+            if len(self._stale_stoves) < len(self._stoves):
+                self._async_schedule_snapshot_save()
+
+            update_interval = self._compute_update_interval()
+            if update_interval != self.update_interval:
+                _LOGGER.debug(f"Adjusting scan interval to {update_interval.total_seconds()}s")
+                self.update_interval = update_interval
+
             _LOGGER.debug(f"Coordinator async_update_data returning data for stoves: {list(data.keys())}")
+            result = trace.result or "ok"
             return data
 
         except Exception as exception:
             _LOGGER.error(f'Update failed for Rika Firenet: {exception}', exc_info=True)
+            result = f"failed: {exception}"
             raise UpdateFailed(f"Error communicating with API: {exception}") from exception
+        finally:
+            self._tracer.end(trace, token, result)
+
+    async def _async_probe(self):
+        """Check with a single status request, without retries, whether Rika Firenet answers again.
+
+        A persisted session rejected by the server does not use up the probe: it logs in again once.
+        """
+        stove = self._stoves[0]
+        try:
+            new_state = await self.get_stove_state(stove.get_id(), max_attempts=1)
+            if new_state is None and not self.is_authenticated():
+                new_state = await self.get_stove_state(stove.get_id(), max_attempts=1)
+        except Exception as e:
+            # E.g. the login page served during the outage: keep serving the last known state
+            _LOGGER.warning(f"Rika Firenet probe failed: {e}")
+            return False
+        if new_state is None:
+            return False
+        stove.update_internal_state(new_state)
+        return True
+
+    def _last_contact_since(self, since):
+        return any(last_contact >= since for last_contact in self._last_contact.values())
+
+    def is_stove_stale(self, stove_id):
+        """True when the stove's state was not refreshed by the last update."""
+        return stove_id in self._stale_stoves
+
+    @callback
+    def async_update_listeners(self):
+        """Notify entities, recording first which snapshot fields changed per stove."""
+        self._changed_fields = {stove.get_id(): stove.pop_changed_fields() for stove in self._stoves}
+        super().async_update_listeners()
+
+    def get_changed_fields(self, stove_id):
+        """Snapshot fields of a stove changed since the previous notification, or None if unknown."""
+        return self._changed_fields.get(stove_id)
+
+    def get_last_contact(self, stove_id):
+        """Wall clock time of the last payload received for a stove, or None."""
+        last_contact = self._last_contact.get(stove_id)
+        if last_contact is None:
+            return None
+        return dt_util.utcnow() - timedelta(seconds=time.monotonic() - last_contact)
+
+    async def setup(self):
+        """Load the stoves; returns True when they were restored from the persisted snapshot.
 
-    def setup(self):
+        Restored stoves serve their last known payload, marked stale, until the first poll.
+        """
         _LOGGER.info("Setting up coordinator")
         try:
-            self._stoves = self.setup_stoves()
+            await self._async_restore_session()
+            await self._async_load_command_queue()
+            if await self._async_restore_snapshot():
+                _LOGGER.info(f"Restored {len(self._stoves)} stoves from the last known snapshot")
+                return True
+            self._stoves = await self.setup_stoves()
             if not self._stoves:
                 _LOGGER.warning("No stoves found during Rika Firenet setup.")
             else:
                 _LOGGER.info(f"Found {len(self._stoves)} stoves:")
                 for stove in self._stoves:
-                    _LOGGER.info(f"  - ID: {stove.get_id()}, Name: {stove.get_name()}") # Initial state synchronization for each stove
-                    stove.sync_state() # sync_state itself logs "Syncing state..."
+                    _LOGGER.info(f"  - ID: {stove.get_id()}, Name: {stove.get_name()}")
+                # Initial state synchronization for all stoves at once; sync_state itself logs "Syncing state..."
+                await asyncio.gather(*(stove.sync_state() for stove in self._stoves))
+            return False
         except Exception as e:
             _LOGGER.error(f"Error during RikaFirenetCoordinator setup_stoves: {e}", exc_info=True) # Re-raise for ConfigEntryNotReady to be triggered
             raise # Relancer pour que ConfigEntryNotReady soit déclenché
 
+    async def _async_restore_snapshot(self):
+        """Recreate the stoves and their last known payloads from storage."""
+        if self._snapshot_store is None:
+            return False
+        data = await self._snapshot_store.async_load()
+        if not data or not data.get('stoves'):
+            return False
+        now = time.monotonic()
+        oldest = time.time() - STALE_STATE_MAX_AGE
+        stoves = []
+        for item in data['stoves']:
+            last_contact = item.get('last_contact')
+            if not item.get('state') or last_contact is None or last_contact < oldest:
+                # Too old to be served: the stove list check after the first poll adds the stove back
+                _LOGGER.info(f"Not restoring stove {item['id']}, its last known state is too old")
+                continue
+            stove = RikaFirenetStove(self, item['id'], item['name'])
+            stove.restore_state(item['state'])
+            self._last_contact[stove.get_id()] = now - max(0, time.time() - last_contact)
+            stoves.append(stove)
+        if not stoves:
+            return False
+        self._stoves = stoves
+        self._stale_stoves = {stove.get_id() for stove in stoves}
+        self.data = {stove.get_id(): stove.get_state() for stove in stoves if stove.get_state() is not None}
+        return True
+
+    async def _async_load_command_queue(self):
+        """Load the controls the stoves had not accepted before the restart, they are replayed on the next poll."""
+        if self._command_queue_store is None:
+            return
+        data = await self._command_queue_store.async_load()
+        if not data:
+            return
+        oldest = time.time() - COMMAND_QUEUE_MAX_AGE
+        for stove_id, commands in data.get('stoves', {}).items():
+            queued = {key: (value, queued_at) for key, value, queued_at in commands if queued_at > oldest}
+            if queued:
+                self._command_queue[stove_id] = queued
+        self._commands_to_replay = {stove_id: dict(queued) for stove_id, queued in self._command_queue.items()}
+        if self._commands_to_replay:
+            _LOGGER.info(f"Controls queued before the restart for stoves {list(self._commands_to_replay)}")
+
+    @callback
+    def _async_queue_commands(self, stove):
+        """Mirror the controls of a stove not accepted yet in the persisted command queue.
+
+        Only the last value per control is kept; a control keeps the time it was first queued with this value.
+        """
+        if self._command_queue_store is None:
+            return
+        stove_id = stove.get_id()
+        queued = self._command_queue.get(stove_id, {})
+        now = time.time()
+        commands = {}
+        for key, value in stove.get_unconfirmed_controls().items():
+            previous = queued.get(key)
+            commands[key] = previous if previous is not None and previous[0] == value else (value, now)
+        if commands == queued:
+            return
+        if commands:
+            self._command_queue[stove_id] = commands
+        else:
+            self._command_queue.pop(stove_id, None)
+        self._async_save_command_queue()
+
+    @callback
+    def _async_save_command_queue(self):
+        if self._command_queue_store is None:
+            return
+        # Written as soon as possible: the queue has to survive a restart right after a command
+        self._command_queue_store.async_delay_save(self._command_queue_data, 0)
+
+    @callback
+    def _command_queue_data(self):
+        return {
+            'stoves': {
+                stove_id: [[key, value, queued_at] for key, (value, queued_at) in commands.items()]
+                for stove_id, commands in self._command_queue.items()
+            }
+        }
+
+    def discard_replayed_controls(self, stove_id, controls):
+        """Drop queued controls waiting to be replayed after the restart that a newer command sets again."""
+        commands = self._commands_to_replay.get(stove_id)
+        if not commands:
+            return
+        for key in controls:
+            commands.pop(key, None)
+        if not commands:
+            del self._commands_to_replay[stove_id]
+
+    async def _async_replay_commands(self, stove):
+        """Apply the controls queued before the restart on a fresh payload and send the ones still needed.
+
+        Must be called with the stove's control lock held. Kept for the next poll if the stove does not answer.
+        """
+        stove_id = stove.get_id()
+        new_state = await self.get_stove_state(stove_id)
+        if new_state is None:
+            return
+        stove.update_internal_state(new_state)
+        oldest = time.time() - COMMAND_QUEUE_MAX_AGE
+        controls = {
+            key: value for key, (value, queued_at) in self._commands_to_replay.pop(stove_id, {}).items()
+            if queued_at > oldest
+        }
+        if controls:
+            # Controls the stove already has are dropped instead of being sent again
+            _LOGGER.info(f"Replaying controls {list(controls)} queued for stove {stove_id} before the restart")
+            stove.replay_controls(controls)
+        self._async_queue_commands(stove)
+        if stove.has_pending_changes():
+            await self._async_send_pending_controls(stove)
+
+    @callback
+    def _async_schedule_snapshot_save(self):
+        """Write the snapshot at most once every SNAPSHOT_SAVE_DELAY seconds, with the data of that time.
+
+        async_delay_save restarts its timer on every call, so it is only called when no save is scheduled:
+        with polls closer than the delay, it would otherwise only write at shutdown.
+        """
+        if self._snapshot_store is None:
+            return
+        now = time.monotonic()
+        if self._snapshot_save_due is not None and now < self._snapshot_save_due:
+            return
+        self._snapshot_save_due = now + SNAPSHOT_SAVE_DELAY
+        self._snapshot_store.async_delay_save(self._snapshot_data, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _snapshot_data(self):
+        stoves = []
+        for stove in self._stoves:
+            last_contact = self.get_last_contact(stove.get_id())
+            stoves.append({
+                'id': stove.get_id(),
+                'name': stove.get_name(),
+                # Only what the stove confirmed, not the controls changed locally since
+                'state': stove.get_payload(),
+                'last_contact': last_contact.timestamp() if last_contact else None,
+            })
+        return {'stoves': stoves}
+
+    def _compute_update_interval(self):
+        """Poll at the pace of the most active stove."""
+        intervals = [self._get_stove_scan_interval(stove) for stove in self._stoves]
+        return min(intervals, default=self._default_scan_interval)
+
+    def _get_stove_scan_interval(self, stove):
+        if stove.has_pending_changes():
+            return self._fast_scan_interval
+        if stove.get_state() is None or stove.get_last_seen_minutes() > 2:
+            return self._offline_scan_interval
+        main_state = stove.get_main_state()
+        if main_state in FAST_POLL_MAIN_STATES:
+            return self._fast_scan_interval
+        if main_state == 0 or (main_state == 1 and stove.get_sub_state() == 0) or not stove.is_stove_on():
+            return self._idle_scan_interval
+        return self._default_scan_interval
+
+    def get_request_stats(self):
+        return self._request_stats
+
+    def _get_last_latency_ms(self, endpoint, stove_id):
+        stats = self._request_stats.get(endpoint, stove_id)
+        if stats is None or stats.last_latency is None:
+            return None
+        return round(stats.last_latency * 1000)
+
+    def get_status_latency(self, stove_id):
+        return self._get_last_latency_ms(ENDPOINT_STATUS, stove_id)
+
+    def get_controls_latency(self, stove_id):
+        return self._get_last_latency_ms(ENDPOINT_CONTROLS, stove_id)
+
+    def get_timeout_count(self, stove_id):
+        return self._request_stats.get_timeouts(stove_id)
+
+    def get_diagnostics(self):
+        """Coordinator state and request stats for the diagnostics download."""
+        return {
+            "update_interval": self.update_interval.total_seconds() if self.update_interval else None,
+            "circuit_breaker": self._circuit_breaker.state,
+            "number_fail": self._number_fail,
+            "requests": self._request_stats.as_dict(),
+            "stoves": {
+                stove.get_id(): {
+                    "retries": self._retry_scheduler.get_retry_count(stove.get_id()),
+                    # Retries refused by the per-cycle budget or the cycle deadline
+                    "retries_skipped": self._retry_scheduler.get_skipped_count(stove.get_id()),
+                    "stale": self.is_stove_stale(stove.get_id()),
+                    "pending_changes": stove.has_pending_changes(),
+                    "suppressed_writes": self._suppressed_writes.get(stove.get_id(), 0),
+                    "queued_controls": list(self._command_queue.get(stove.get_id(), {})),
+                    "payload": stove.get_state(),
+                }
+                for stove in self._stoves
+            },
+            "cycles": self._tracer.as_list(),
+        }
+
     def get_stoves(self):
         return self._stoves
 
@@ -107,39 +576,208 @@ class RikaFirenetCoordinator(DataUpdateCoordinator):
     def get_number_fail(self):
         return self._number_fail
 
-    def connect(self):
-        if not self.is_authenticated():
+    def get_retry_count(self, stove_id=None):
+        return self._retry_scheduler.get_retry_count(stove_id)
+
+    async def connect(self):
+        if self.is_authenticated():
+            return
+        # Several stoves may be polled at once; only one of them should log in
+        async with self._login_lock:
+            if self.is_authenticated():
+                return
             data = {'email': self._username, 'password': self._password}
-            response = self._client.post(LOGIN_URL, data)
-            if '/logout' not in response.text:
+            async with self._async_request(
+                ENDPOINT_LOGIN, None, 'POST', self._login_url, data=data, timeout=_TIMEOUT
+            ) as response:
+                text = await response.text()
+            if '/logout' not in text:
                 raise Exception('Failed to connect with Rika Firenet')
             _LOGGER.info('Connected to Rika Firenet')
+            await self._async_save_session()
+
+    @contextlib.asynccontextmanager
+    async def _async_request(self, endpoint, stove_id, method, url, **kwargs):
+        """Send a request and record its latency, size and outcome in the request stats."""
+        start = time.monotonic()
+        response = None
+        error = None
+        timeout = False
+        cancelled = False
+        try:
+            async with self._client.request(method, url, **kwargs) as response:
+                yield response
+                if response.status >= 400:
+                    error = f"HTTP {response.status}"
+        except asyncio.TimeoutError:
+            error = "Timeout"
+            timeout = True
+            raise
+        except asyncio.CancelledError:
+            # Cycle deadline or shutdown, possibly before the response was received
+            error = "cancelled"
+            cancelled = True
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            latency = time.monotonic() - start
+            bytes_received = response.content.total_bytes if response is not None else 0
+            if cancelled:
+                self._request_stats.record_cancelled(endpoint, stove_id)
+            else:
+                self._request_stats.record(endpoint, stove_id, latency, bytes_received, error, timeout)
+            trace = self._tracer.current
+            if trace is not None:
+                trace.add_call(endpoint, stove_id, latency, error or (response.status if response is not None else None))
+
+    def _record_retry(self, endpoint, stove_id):
+        self._request_stats.record_retry(endpoint, stove_id)
+        trace = self._tracer.current
+        if trace is not None:
+            trace.stove(stove_id)['retries'] += 1
+
+    def _trace_stove(self, stove_id, key, value):
+        trace = self._tracer.current
+        if trace is not None:
+            trace.stove(stove_id)[key] = value
+
+    def _get_session_cookie(self):
+        # aiohttp's cookie jar drops expired cookies on iteration, so a
+        # remaining connect.sid is a live session cookie.
+        for cookie in self._client.cookie_jar:
+            if cookie.key == SESSION_COOKIE:
+                return cookie
+        return None
 
     def is_authenticated(self):
-        sid_cookie = None
-        for cookie in self._client.cookies:
-            if cookie.name == 'connect.sid':
-                sid_cookie = cookie
-                break
-
-        if not sid_cookie:
-            return False
+        return self._get_session_cookie() is not None
+
+    def _is_session_rejected(self, response):
+        """The server answers an expired session with 401/403 or a redirect to the login page."""
+        return response.status in (401, 403) or response.url.path == LOGIN_PATH
+
+    async def _async_save_session(self):
+        """Persist the session cookie so a restart or reload does not need a new login."""
+        if self._session_store is None:
+            return
+        cookie = self._get_session_cookie()
+        if cookie is None:
+            return
+        expires = None
+        try:
+            if cookie['max-age']:
+                expires = time.time() + int(cookie['max-age'])
+            elif cookie['expires']:
+                expires = parsedate_to_datetime(cookie['expires']).timestamp()
+        except (ValueError, TypeError):
+            _LOGGER.debug(f"Could not parse session cookie expiry: {cookie['expires']}")
+        await self._session_store.async_save({'sid': cookie.value, 'expires': expires})
+
+    async def _async_restore_session(self):
+        """Load the persisted session cookie, if it has not expired yet."""
+        if self._session_store is None:
+            return
+        data = await self._session_store.async_load()
+        if not data or not data.get('sid'):
+            return
+        expires = data.get('expires')
+        if expires is not None and expires <= time.time():
+            _LOGGER.debug("Persisted Rika Firenet session has expired.")
+            return
+        cookie = SimpleCookie()
+        cookie[SESSION_COOKIE] = data['sid']
+        cookie[SESSION_COOKIE]['path'] = '/'
+        if expires is not None:
+            cookie[SESSION_COOKIE]['max-age'] = str(int(expires - time.time()))
+        self._client.cookie_jar.update_cookies(cookie, URL(self._login_url))
+        _LOGGER.debug("Restored persisted Rika Firenet session.")
+
+    async def _async_drop_session(self):
+        """Forget a session the server rejected, so the next request logs in again."""
+        _LOGGER.info("Rika Firenet session was rejected, logging in again.")
+        self._client.cookie_jar.clear(lambda cookie: cookie.key == SESSION_COOKIE)
+        if self._session_store is not None:
+            await self._session_store.async_remove()
+
+    def _get_cached_state(self, stove_id, max_age=STATUS_CACHE_TTL):
+        """Return the last status payload of a stove if it is younger than max_age seconds."""
+        cached = self._status_cache.get(stove_id)
+        if cached and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+        return None
 
-        if sid_cookie.expires and sid_cookie.expires <= int(datetime.now().timestamp()):
-            _LOGGER.debug("Rika Firenet session cookie expired.")
-            return False
+    def _cache_state(self, stove_id, state):
+        now = time.monotonic()
+        self._status_cache[stove_id] = (now, state)
+        self._last_contact[stove_id] = now
+        revision = state.get('controls', {}).get('revision')
+        if revision is not None:
+            self._revisions[stove_id] = revision
+        self._resolve_confirmations(stove_id, state.get('controls'))
+
+    def _resolve_confirmations(self, stove_id, controls):
+        """Wake up the commands confirmed by the controls of a status payload."""
+        waiters = self._confirmation_waiters.get(stove_id)
+        if not waiters or not isinstance(controls, dict):
+            return
+        revision = controls.get('revision')
+        for requested, sent_revision, future in waiters:
+            if future.done():
+                continue
+            if (revision is not None and sent_revision is not None and revision > sent_revision) or all(
+                _same_control_value(value, controls.get(key)) for key, value in requested.items()
+            ):
+                future.set_result(True)
+
+    def _set_confirmation_revision(self, stove_id, controls):
+        """Record the revision an accepted write was sent with on the commands it carries.
+
+        The stove bumps its revision when it takes the write, so a payload with a newer revision confirms them.
+        """
+        for waiter in self._confirmation_waiters.get(stove_id, []):
+            requested, sent_revision, _ = waiter
+            if sent_revision is None and all(
+                _same_control_value(value, controls.get(key)) for key, value in requested.items()
+            ):
+                waiter[1] = controls.get('revision')
+
+    def _invalidate_revision(self, stove_id):
+        """Forget the cached status and revision, e.g. after the stove accepted or rejected a write."""
+        self._status_cache.pop(stove_id, None)
+        self._revisions.pop(stove_id, None)
+
+    async def get_stove_revision(self, stove_id):
+        """Return the current controls revision, only fetching the status when it is not known."""
+        revision = self._revisions.get(stove_id)
+        if revision is not None:
+            return revision
+        current_state = await self.get_stove_state(stove_id)
+        if current_state and 'controls' in current_state:
+            return current_state['controls'].get('revision')
+        return None
 
-        return True
+    async def get_stove_state(self, stove_id, max_age=0, max_attempts=3):
+        if max_age:
+            cached_state = self._get_cached_state(stove_id, max_age)
+            if cached_state is not None:
+                _LOGGER.debug(f"Using cached state for stove {stove_id}")
+                return cached_state
 
-    def get_stove_state(self, stove_id):
-        MAX_RETRIES = 3
+        MAX_RETRIES = max_attempts
         for attempt in range(MAX_RETRIES):
+            session_rejected = False
             try:
-                self.connect() # Ensure connection
-                url = STATUS_URL.format(stove_id=stove_id) + f'?nocache={int(time.time())}'
-                response = self._client.get(url, timeout=10)
-                response.raise_for_status() # Raise an exception for HTTP error codes
-                data = response.json()
+                await self.connect() # Ensure connection
+                url = self._status_url.format(stove_id=stove_id) + f'?nocache={int(time.time())}'
+                async with self._async_request(ENDPOINT_STATUS, stove_id, 'GET', url, timeout=_TIMEOUT) as response:
+                    session_rejected = self._is_session_rejected(response)
+                    if session_rejected:
+                        await self._async_drop_session()
+                        continue # Log in again right away
+                    response.raise_for_status() # Raise an exception for HTTP error codes
+                    data = await response.json(content_type=None)
                 
                 # Validation des données critiques pour les statistiques
                 if 'sensors' in data:
@@ -154,219 +792,832 @@ class RikaFirenetCoordinator(DataUpdateCoordinator):
                                 data['sensors'][field] = None  # Invalider la valeur
                 
                 _LOGGER.debug(f'get_stove_state for {stove_id}: {str(data)}...')
+                self._trace_stove(stove_id, 'revision_received', (data.get('controls') or {}).get('revision'))
+                self._cache_state(stove_id, data)
                 return data
-            except requests.exceptions.Timeout:
+            except asyncio.TimeoutError:
                 _LOGGER.warning(f"Timeout getting state for stove {stove_id} (attempt {attempt + 1}/{MAX_RETRIES})")
-            except requests.exceptions.RequestException as e:
-                _LOGGER.error(f"RequestException getting state for stove {stove_id} (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
+            except aiohttp.ClientError as e:
+                _LOGGER.error(f"ClientError getting state for stove {stove_id} (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
             except ValueError: # JSON decoding error
                 _LOGGER.error(f"Error decoding JSON for stove {stove_id} state (attempt {attempt + 1}/{MAX_RETRIES})")
             
             if attempt < MAX_RETRIES - 1:  # Ne pas attendre après la dernière tentative
-                time.sleep(2)  # Attendre 2 secondes avant de réessayer
+                if not await self._retry_scheduler.async_wait(stove_id, attempt):
+                    break
+                self._record_retry(ENDPOINT_STATUS, stove_id)
                 
         return None # Return None après l'échec de toutes les tentatives
 
-    def setup_stoves(self):
-        self.connect()
+    async def setup_stoves(self):
         stoves = []
-        response = self._client.get(SUMMARY_URL, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
-        stove_list = soup.find("ul", {"id": "stoveList"})
-
-        if stove_list:
-            for stove_item in stove_list.find_all('li'): # Corrected: use stove_item here
-                stove_link = stove_item.find('a', href=True) # Corrected: use stove_item here
-                if stove_link and stove_link.attrs['href']:
-                    stove_id_from_link = stove_link.attrs['href'].rsplit('/', 1)[-1]
-                    stove_display_name = stove_link.text.strip()
-                    if not stove_id_from_link:
-                        _LOGGER.warning(f"Could not extract stove ID from link: {stove_link.attrs['href']}")
-                        continue
-                    stove = RikaFirenetStove(self, stove_id_from_link, stove_display_name)
-                    _LOGGER.info(f"Discovered stove: ID={stove.get_id()}, Name='{stove.get_name()}'")
-                    stoves.append(stove)
-                else:
-                    _LOGGER.warning(f"Could not find valid link in stove list item: {stove_item}")
+        for stove_id, name in await self.discover_stoves():
+            stove = RikaFirenetStove(self, stove_id, name)
+            _LOGGER.info(f"Discovered stove: ID={stove.get_id()}, Name='{stove.get_name()}'")
+            stoves.append(stove)
         return stoves
 
-    def update(self):
-        _LOGGER.debug("Coordinator synchronous update started")
+    async def discover_stoves(self):
+        """Returns the (id, name) of the stoves listed on the summary page.
+
+        An expired session is answered with the login page: the summary is asked again once after logging in.
+        """
+        for attempt in range(2):
+            await self.connect()
+            parser = StoveListParser()
+            content = bytearray()
+            async with self._async_request(ENDPOINT_SUMMARY, None, 'GET', self._summary_url, timeout=_TIMEOUT) as response:
+                session_rejected = self._is_session_rejected(response)
+                if not session_rejected:
+                    response.raise_for_status()
+                    decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace')
+                    # The stove list is near the top of the page, stop reading once it is closed
+                    async for chunk in response.content.iter_any():
+                        content += chunk
+                        parser.feed(decoder.decode(chunk))
+                        if parser.done:
+                            return parser.stoves
+                    if parser.found:
+                        return parser.stoves
+            if not session_rejected and b'/logout' in content:
+                break
+            if attempt:
+                _LOGGER.warning("Rika Firenet summary page still not logged in after logging in again")
+                break
+            await self._async_drop_session()
+        _LOGGER.debug("Stove list not found by the streaming parser, trying BeautifulSoup")
+        return await self.hass.async_add_executor_job(parse_stove_list_bs4, bytes(content))
 
-        for stove in self._stoves:
+    async def async_rediscover_stoves(self):
+        """Checks the stove list against the summary page and applies the difference.
+
+        A stove is removed once it was missing from DISCOVERY_MISSES_BEFORE_REMOVAL checks in a row.
+        Returns the stoves added (with their state synced and in the coordinator data) and the ids of the stoves removed.
+        """
+        try:
+            discovered = await self.discover_stoves()
+        except Exception as e:
+            _LOGGER.warning(f"Could not check the stove list: {e}")
+            return [], []
+        if not discovered:
+            # An empty list is more likely a page we could not read than an empty account
+            return [], []
+        discovered_ids = {stove_id for stove_id, _ in discovered}
+        known_ids = {stove.get_id() for stove in self._stoves}
+        for stove_id in known_ids & discovered_ids:
+            self._discovery_misses.pop(stove_id, None)
+        removed = []
+        for stove_id in sorted(known_ids - discovered_ids):
+            misses = self._discovery_misses.get(stove_id, 0) + 1
+            if misses < DISCOVERY_MISSES_BEFORE_REMOVAL:
+                _LOGGER.info(f"Stove {stove_id} missing from the stove list ({misses}/{DISCOVERY_MISSES_BEFORE_REMOVAL})")
+                self._discovery_misses[stove_id] = misses
+            else:
+                removed.append(stove_id)
+        added = [
+            RikaFirenetStove(self, stove_id, name)
+            for stove_id, name in discovered if stove_id not in known_ids
+        ]
+        if not added and not removed:
+            return [], []
+
+        _LOGGER.info(f"Stove list changed: added {[stove.get_id() for stove in added]}, removed {removed}")
+        await asyncio.gather(*(stove.sync_state() for stove in added))
+        for stove_id in removed:
+            self._forget_stove(stove_id)
+        self._stoves = [stove for stove in self._stoves if stove.get_id() not in removed] + added
+        # Available as soon as their entities are added, not from the next poll
+        self.data = {
+            **{stove_id: state for stove_id, state in (self.data or {}).items() if stove_id not in removed},
+            **{stove.get_id(): stove.get_state() for stove in added if stove.get_state() is not None},
+        }
+        self._async_schedule_snapshot_save()
+        return added, removed
+
+    def _forget_stove(self, stove_id):
+        self._discovery_misses.pop(stove_id, None)
+        flush_task = self._control_flush_tasks.pop(stove_id, None)
+        if flush_task is not None:
+            flush_task.cancel()
+        self._status_cache.pop(stove_id, None)
+        self._revisions.pop(stove_id, None)
+        self._last_contact.pop(stove_id, None)
+        self._changed_fields.pop(stove_id, None)
+        self._stale_stoves.discard(stove_id)
+        self._suppressed_writes.pop(stove_id, None)
+        self._commands_to_replay.pop(stove_id, None)
+        if self._command_queue.pop(stove_id, None) is not None:
+            self._async_save_command_queue()
+        for _, _, future in self._confirmation_waiters.pop(stove_id, []):
+            future.cancel()
+        self._request_stats.forget_stove(stove_id)
+
+    async def update(self):
+        _LOGGER.debug("Coordinator update started")
+        if not self._stoves:
+            return
+
+        # Poll every stove in parallel so one unreachable stove does not delay the others
+        self._retry_scheduler.start_cycle(time.monotonic() + UPDATE_CYCLE_TIMEOUT)
+        tasks = [
+            asyncio.create_task(self._async_update_stove_bounded(stove), name=f"{DOMAIN}_update_{stove.get_id()}")
+            for stove in self._stoves
+        ]
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=UPDATE_CYCLE_TIMEOUT)
+        finally:
+            self._retry_scheduler.end_cycle()
+        if pending:
+            _LOGGER.warning(f"Update cycle deadline of {UPDATE_CYCLE_TIMEOUT}s reached, {len(pending)} stove(s) keep their previous state.")
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _async_update_stove_bounded(self, stove):
+        queued = time.monotonic()
+        async with self._update_semaphore:
+            started = time.monotonic()
             try:
-                if stove.has_pending_changes() and stove.get_state(): # Check if state exists
+                await self._async_update_stove(stove)
+            finally:
+                trace = self._tracer.current
+                if trace is not None:
+                    details = trace.stove(stove.get_id())
+                    details['queued'] = round(started - queued, 3)
+                    details['duration'] = round(time.monotonic() - started, 3)
+                    details['pending_changes'] = stove.has_pending_changes()
+
+    def _get_control_lock(self, stove_id):
+        """Per-stove lock serialising control writes with status polls."""
+        return self._control_locks.setdefault(stove_id, asyncio.Lock())
+
+    async def _async_update_stove(self, stove):
+        try:
+            async with self._get_control_lock(stove.get_id()):
+                if stove.get_id() in self._commands_to_replay:
+                    await self._async_replay_commands(stove)
+                elif stove.has_pending_changes() and stove.get_state(): # Check if state exists
                     _LOGGER.debug(f"Stove {stove.get_id()} has pending changes. Sending controls.")
-                    current_controls = stove.get_control_state()
-                    if current_controls:
-                        updated_state_after_send = self.set_stove_controls(stove.get_id(), current_controls)
-                        if updated_state_after_send:
-                            stove.update_internal_state(updated_state_after_send) # Update the stove's internal state
-                            stove.clear_pending_changes() # Mark changes as sent
-                        else:
-                            _LOGGER.warning(f"Failed to send controls for stove {stove.get_id()}, changes remain pending. Will retry on next update.")
-                            # Do not clear pending changes so they are retried
-                    else:
-                         _LOGGER.warning(f"Cannot send controls for stove {stove.get_id()} because control state is missing.")
+                    await self._async_send_pending_controls(stove)
                 else:
                     # _LOGGER.debug(f"Syncing state for stove {stove.get_id()}") # Removed, sync_state logs itself
-                    stove.sync_state() # Retrieves and updates the stove's state
-
-                # Restart logic 
-                current_stove_state = stove.get_state()
-                if current_stove_state and stove.get_main_state() == 6 and stove.is_stove_on():
-                    _LOGGER.info(f'Stove {stove.get_id()} (mainState=6 and On) may need a restart.')
-                    stove.set_stove_on_off(False) 
-                    stove.set_stove_on_off(True)
-            except Exception as e:
-                _LOGGER.error(f"Error processing stove {stove.get_id()} in coordinator update: {e}", exc_info=True)
-
-    def set_stove_controls(self, stove_id, controls):
+                    await stove.sync_state() # Retrieves and updates the stove's state
+        except Exception as e:
+            _LOGGER.error(f"Error processing stove {stove.get_id()} in coordinator update: {e}", exc_info=True)
+
+    async def _async_send_pending_controls(self, stove):
+        """Send the stove's pending controls in one POST. Must be called with the stove's control lock held."""
+        if not stove.has_pending_changes():
+            return True
+        if stove.is_restored():
+            # The controls restored from the snapshot may be outdated and must not be posted back
+            new_state = await self.get_stove_state(stove.get_id())
+            if new_state is None:
+                return False
+            stove.update_internal_state(new_state)
+        current_controls = stove.get_control_state()
+        if not current_controls:
+            _LOGGER.warning(f"Cannot send controls for stove {stove.get_id()} because control state is missing.")
+            return False
+
+        # Changes made while the POST is in flight stay pending for the next write
+        sent_changes = stove.pop_pending_changes()
+        try:
+            updated_state_after_send = await self.set_stove_controls(
+                stove.get_id(), dict(current_controls), fetch_state=not self._optimistic_writes
+            )
+        except BaseException:
+            # Login failure, cancellation...: the changes were not accepted, keep them for the next write
+            stove.restore_pending_changes(sent_changes)
+            self._async_queue_commands(stove)
+            raise
+        if updated_state_after_send and self._optimistic_writes:
+            # Trust the accepted controls; the next regular poll reconciles the rest of the state
+            stove.apply_accepted_controls(updated_state_after_send)
+            stove.confirm_sent_controls()
+            self._async_queue_commands(stove)
+            return True
+        if updated_state_after_send:
+            stove.update_internal_state(updated_state_after_send) # Update the stove's internal state
+            stove.confirm_sent_controls()
+            self._async_queue_commands(stove)
+            return True
+
+        _LOGGER.warning(f"Failed to send controls for stove {stove.get_id()}, changes remain pending. Will retry on next update.")
+        stove.restore_pending_changes(sent_changes)
+        self._async_queue_commands(stove)
+        return False
+
+    async def async_request_controls_update(self, stove):
+        """Send the stove's pending controls, merging every change made within the coalescing window.
+
+        Returns True once the controls have been accepted by the stove.
+        """
+        stove_id = stove.get_id()
+        self._async_queue_commands(stove)
+        if not stove.has_pending_changes() and stove_id not in self._control_flush_tasks:
+            # Nothing differs from what the stove last confirmed: no POST, no status fetch
+            _LOGGER.debug(f"Controls of stove {stove_id} unchanged, write skipped")
+            self._suppressed_writes[stove_id] = self._suppressed_writes.get(stove_id, 0) + 1
+            return True
+        future = self.hass.loop.create_future()
+        self._control_waiters.setdefault(stove_id, []).append(future)
+        if stove_id not in self._control_flush_tasks:
+            self._control_flush_tasks[stove_id] = self.hass.async_create_background_task(
+                self._async_flush_controls(stove), name=f"{DOMAIN}_flush_{stove_id}"
+            )
+        return await future
+
+    async def async_apply_controls(self, stove, timeout=CONTROLS_CONFIRM_TIMEOUT):
+        """Send the stove's pending controls and wait until the stove confirms them.
+
+        Returns True as soon as a status payload shows the requested controls, or a
+        revision newer than the one their write was accepted with; False right away
+        if the write failed, or if the confirmation did not come within timeout seconds.
+        """
+        stove_id = stove.get_id()
+        requested = stove.get_pending_controls()
+        if not requested:
+            return await self.async_request_controls_update(stove)
+        future = self.hass.loop.create_future()
+        entry = [requested, None, future]
+        self._confirmation_waiters.setdefault(stove_id, []).append(entry)
+        try:
+            return await asyncio.wait_for(self._async_request_and_confirm(stove, future), timeout)
+        except asyncio.TimeoutError:
+            _LOGGER.warning(f"Stove {stove_id} did not confirm {list(requested)} within {timeout}s")
+            return False
+        finally:
+            waiters = [waiter for waiter in self._confirmation_waiters.get(stove_id, []) if waiter is not entry]
+            if waiters:
+                self._confirmation_waiters[stove_id] = waiters
+            else:
+                self._confirmation_waiters.pop(stove_id, None)
+
+    async def _async_request_and_confirm(self, stove, future):
+        if not await self.async_request_controls_update(stove):
+            # Not sent: the changes stay pending for the next poll, nothing will confirm them meanwhile
+            future.cancel()
+            return False
+        if not future.done():
+            # Optimistic writes do not fetch the status: fetch it once instead of waiting for the next poll
+            await self._async_fetch_confirmation(stove)
+        # Otherwise confirmed by a later poll
+        return await future
+
+    async def _async_fetch_confirmation(self, stove):
+        async with self._get_control_lock(stove.get_id()):
+            new_state = await self.get_stove_state(stove.get_id())
+            if new_state is None:
+                return
+            stove.update_internal_state(new_state)
+        self.async_update_listeners()
+
+    async def _async_flush_controls(self, stove):
+        stove_id = stove.get_id()
+        await asyncio.sleep(CONTROLS_COALESCE_WINDOW_MS / 1000)
+        # Changes requested from now on open a new window
+        self._control_flush_tasks.pop(stove_id, None)
+        waiters = self._control_waiters.pop(stove_id, [])
+
+        trace, token = self._tracer.start("write")
+        result = "failed"
+        success = False
+        try:
+            if self._circuit_breaker.state == STATE_OPEN:
+                # Keep the changes pending, they are sent once Rika Firenet answers again
+                _LOGGER.warning(f"Rika Firenet unreachable, controls for stove {stove_id} will be sent later")
+                result = "deferred, circuit breaker open"
+                return
+            async with self._get_control_lock(stove_id):
+                success = await self._async_send_pending_controls(stove)
+            result = "ok" if success else "failed"
+        except Exception as e:
+            _LOGGER.error(f"Error sending controls for stove {stove_id}: {e}", exc_info=True)
+        finally:
+            trace.stove(stove_id)['pending_changes'] = stove.has_pending_changes()
+            self._tracer.end(trace, token, result)
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(success)
+        self.async_update_listeners()
+
+    async def async_shutdown(self):
+        """Cancel scheduled control writes, write the pending saves and close the client session."""
+        flush_tasks = list(self._control_flush_tasks.values())
+        for task in flush_tasks:
+            task.cancel()
+        self._control_flush_tasks.clear()
+        for waiters in self._control_waiters.values():
+            for waiter in waiters:
+                waiter.cancel()
+        self._control_waiters.clear()
+        for waiters in self._confirmation_waiters.values():
+            for _, _, future in waiters:
+                future.cancel()
+        self._confirmation_waiters.clear()
+        await super().async_shutdown()
+        # A write cancelled while in flight puts its controls back in the command queue
+        await asyncio.gather(*flush_tasks, return_exceptions=True)
+        await self._async_flush_stores()
+        # Each coordinator has its own session: release it so a reload does not leak it.
+        # Detached, not closed: the connector is shared with the rest of Home Assistant
+        self._client.detach()
+
+    async def _async_flush_stores(self):
+        """Write the pending saves now and stop saving, so no delayed save outlives the coordinator."""
+        if self._snapshot_store is not None and self._snapshot_save_due is not None and (
+            time.monotonic() < self._snapshot_save_due
+        ):
+            await self._snapshot_store.async_save(self._snapshot_data())
+        if self._command_queue_store is not None:
+            await self._command_queue_store.async_save(self._command_queue_data())
+        self._session_store = self._snapshot_store = self._command_queue_store = None
+
+    async def set_stove_controls(self, stove_id, controls, fetch_state=True):
+        """Send controls to a stove.
+
+        Returns the fresh stove state once accepted, or the accepted controls when fetch_state is False.
+        """
         _LOGGER.debug(f"set_stove_controls for {stove_id}, data: {str(controls)}")
         # Ensure revision is present if the API requires it
         if 'revision' not in controls:
-            current_state = self.get_stove_state(stove_id)
-            if current_state and 'controls' in current_state and 'revision' in current_state['controls']:
-                controls['revision'] = current_state['controls']['revision']
+            revision = await self.get_stove_revision(stove_id)
+            if revision is not None:
+                controls['revision'] = revision
                 _LOGGER.debug(f"Added revision {controls['revision']} to controls for {stove_id}")
             else:
                 _LOGGER.warning(f"Could not get revision for stove {stove_id}. Sending controls without it.")
 
-        for attempt in range(3): # Reduce the number of attempts for faster feedback
-            _LOGGER.info(f'Attempting to update stove {stove_id} controls ({attempt + 1}/3)')
+        MAX_ATTEMPTS = 3 # Reduce the number of attempts for faster feedback
+        for attempt in range(MAX_ATTEMPTS):
+            _LOGGER.info(f'Attempting to update stove {stove_id} controls ({attempt + 1}/{MAX_ATTEMPTS})')
+            revision_rejected = False
+            self._trace_stove(stove_id, 'revision_sent', controls.get('revision'))
             try:
-                response = self._client.post(
-                    CONTROLS_URL.format(stove_id=stove_id), json=controls, timeout=15
-                )
-                if 'OK' in response.text:
+                await self.connect() # Ensure connection
+                async with self._async_request(
+                    ENDPOINT_CONTROLS, stove_id, 'POST',
+                    self._controls_url.format(stove_id=stove_id), json=controls, timeout=_CONTROLS_TIMEOUT,
+                ) as response:
+                    session_rejected = self._is_session_rejected(response)
+                    text = await response.text()
+                if session_rejected:
+                    # Not a revision problem: log in again and resend as is
+                    await self._async_drop_session()
+                    continue
+                if 'OK' in text:
                     _LOGGER.info(f'Stove {stove_id} controls updated successfully via API.')
                     self._number_fail = 0
-                    # Return fresh state after successful update
-                    return self.get_stove_state(stove_id) # Important to get the latest revision
+                    self._last_contact[stove_id] = time.monotonic()
+                    # The stove bumped its revision: return fresh state after successful update
+                    self._invalidate_revision(stove_id)
+                    self._set_confirmation_revision(stove_id, controls)
+                    if not fetch_state:
+                        return controls
+                    return await self.get_stove_state(stove_id) # Important to get the latest revision
                 else:
-                    _LOGGER.warning(f"Update for stove {stove_id} API call returned not OK: {response.status_code} - {response.text}")
-            except requests.exceptions.RequestException as e:
+                    _LOGGER.warning(f"Update for stove {stove_id} API call returned not OK: {response.status} - {text}")
+                    revision_rejected = True
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 _LOGGER.warning(f"Network error on attempt {attempt + 1} for stove {stove_id}: {e}")
 
             # This block runs if the update was not successful (not "OK" or a network error)
             self._number_fail += 1
-            time.sleep(5)
+            if attempt == MAX_ATTEMPTS - 1 or not await self._retry_scheduler.async_wait(stove_id, attempt):
+                break
+            self._record_retry(ENDPOINT_CONTROLS, stove_id)
+            if not revision_rejected:
+                # The request never reached the stove, the revision we sent is still current
+                continue
             # Update revision before the next attempt, as it might have changed
-            current_state_for_rev = self.get_stove_state(stove_id)
-            if current_state_for_rev and 'controls' in current_state_for_rev and 'revision' in current_state_for_rev['controls']:
-                controls['revision'] = current_state_for_rev['controls']['revision']
+            self._invalidate_revision(stove_id)
+            revision = await self.get_stove_revision(stove_id)
+            if revision is not None:
+                controls['revision'] = revision
                 _LOGGER.info(f"Updated revision to {controls['revision']} for stove {stove_id} before retry.")
             else:
                 _LOGGER.warning(f"Could not get new revision for stove {stove_id} before retry.")
-        _LOGGER.error(f'Failed to update stove {stove_id} controls after 3 attempts')
+        _LOGGER.error(f'Failed to update stove {stove_id} controls after {attempt + 1} attempts')
         return None # Indicate persistent failure
 
+# States indicating active heating (ignition, running, split log mode)
+HEATING_MAIN_STATES = frozenset([2, 3, 4, 11, 13, 14, 16, 17, 20, 21, 50])
+# States indicating the stove is on but not actively producing heat (standby, cleaning, burn-off)
+IDLE_MAIN_STATES = frozenset([5, 6])
+
+def _same_control_value(expected, actual):
+    """Compares control values loosely: Firenet returns some numbers as strings ("21" for 21.0)."""
+    if expected == actual:
+        return True
+    try:
+        return float(expected) == float(actual)
+    except (TypeError, ValueError):
+        return False
+
+def _tenths(value):
+    return float(value) / 10.0
+
+def _minutes_to_hours(value):
+    return int(value) // 60
+
+# Snapshot attribute -> (payload section, Firenet key, converter, value when missing or invalid)
+SNAPSHOT_FIELDS = {
+    'last_seen_minutes': (None, 'lastSeenMinutes', int, 99),
+    # Controls
+    'on_off': ('controls', 'onOff', bool, False),
+    'operating_mode': ('controls', 'operatingMode', None, None),
+    'target_temperature': ('controls', 'targetTemperature', float, None),
+    'temperature_offset': ('controls', 'temperatureOffset', float, None),
+    'set_back_temperature': ('controls', 'setBackTemperature', float, None),
+    'room_power_request': ('controls', 'RoomPowerRequest', int, None),
+    'heating_power': ('controls', 'heatingPower', int, None),
+    'eco_mode': ('controls', 'ecoMode', bool, False),
+    'heating_times_active_for_comfort': ('controls', 'heatingTimesActiveForComfort', bool, False),
+    'frost_protection': ('controls', 'frostProtectionActive', bool, False),
+    'frost_protection_temperature': ('controls', 'frostProtectionTemperature', int, None),
+    'convection_fan1_on': ('controls', 'convectionFan1Active', bool, False),
+    'convection_fan1_level': ('controls', 'convectionFan1Level', int, None),
+    'convection_fan1_area': ('controls', 'convectionFan1Area', int, None),
+    'convection_fan2_on': ('controls', 'convectionFan2Active', bool, False),
+    'convection_fan2_level': ('controls', 'convectionFan2Level', int, None),
+    'convection_fan2_area': ('controls', 'convectionFan2Area', int, None),
+    # Sensors
+    'room_temperature': ('sensors', 'inputRoomTemperature', float, None),
+    'stove_temperature': ('sensors', 'inputFlameTemperature', int, None),
+    'main_state': ('sensors', 'statusMainState', int, None),
+    'sub_state': ('sensors', 'statusSubState', int, None),
+    'status_error': ('sensors', 'statusError', int, None),
+    'status_sub_error': ('sensors', 'statusSubError', int, None),
+    'status_warning': ('sensors', 'statusWarning', int, None),
+    'frost_protection_started': ('sensors', 'statusFrostStarted', bool, False),
+    'consumption': ('sensors', 'parameterFeedRateTotal', int, None),
+    'runtime_pellets': ('sensors', 'parameterRuntimePellets', int, None),
+    'runtime_logs': ('sensors', 'parameterRuntimeLogs', _minutes_to_hours, None),
+    'pellets_before_service': ('sensors', 'parameterFeedRateService', int, None),
+    'diag_motor': ('sensors', 'outputDischargeMotor', int, None),
+    'fan_velocity': ('sensors', 'outputIDFan', int, None),
+    'output_air_flaps': ('sensors', 'outputAirFlaps', _tenths, None),
+    # Features
+    'air_flaps_possible': ('stoveFeatures', 'airFlaps', bool, False),
+    'log_runtime_possible': ('stoveFeatures', 'logRuntime', bool, False),
+    'multi_air1': ('stoveFeatures', 'multiAir1', bool, False),
+    'multi_air2': ('stoveFeatures', 'multiAir2', bool, False),
+}
+
+# Payload keys kept in memory, per section; the controls are kept whole since they are posted back
+_KEPT_KEYS = {
+    section: frozenset(key for field_section, key, _, _ in SNAPSHOT_FIELDS.values() if field_section == section)
+    for section in ('sensors', 'stoveFeatures')
+}
+
+_CONTROL_FIELDS = {name: field for name, field in SNAPSHOT_FIELDS.items() if field[0] == 'controls'}
+
+
+def trim_stove_state(state):
+    """Returns a copy of a status payload reduced to the fields the integration uses."""
+    trimmed = {
+        key: value for key, value in state.items()
+        if not isinstance(value, (dict, list))
+    }
+    if isinstance(state.get('controls'), dict):
+        trimmed['controls'] = dict(state['controls'])
+    for section in _KEPT_KEYS:
+        values = state.get(section)
+        if isinstance(values, dict):
+            trimmed[section] = {key: values[key] for key in _KEPT_KEYS[section] if key in values}
+    return trimmed
+
+
+class RikaFirenetStoveSnapshot:
+    """Typed view of a status payload, converted once when the payload is received."""
+
+    __slots__ = tuple(SNAPSHOT_FIELDS) + ('_status',)
+
+    def __init__(self, state=None, stove_id=None):
+        self._status = None
+        self._convert(state or {}, stove_id, SNAPSHOT_FIELDS)
+
+    def with_controls(self, controls, stove_id=None):
+        """Returns a copy with only the control fields converted again, after a local change."""
+        snapshot = object.__new__(RikaFirenetStoveSnapshot)
+        for name in self.__slots__:
+            setattr(snapshot, name, getattr(self, name))
+        snapshot._status = None
+        snapshot._convert({'controls': controls}, stove_id, _CONTROL_FIELDS)
+        return snapshot
+
+    def changed_fields(self, other):
+        """Returns the names of the fields whose value differs from other."""
+        return {name for name in SNAPSHOT_FIELDS if getattr(self, name) != getattr(other, name)}
+
+    def _convert(self, state, stove_id, fields):
+        for name, (section, key, converter, default) in fields.items():
+            values = state if section is None else state.get(section) or {}
+            value = values.get(key)
+            if value is None:
+                value = default
+            elif converter is not None:
+                try:
+                    value = converter(value)
+                except (ValueError, TypeError):
+                    _LOGGER.warning(f"Invalid {key} value for {stove_id}: {value}")
+                    value = default
+            setattr(self, name, value)
+
+    @property
+    def status(self):
+        """Status image and text key, evaluated once per snapshot."""
+        if self._status is None:
+            main_state = self.main_state
+            sub_state = self.sub_state
+            self._status = lookup_status(StatusInputs(
+                self.last_seen_minutes > 2,
+                self.status_warning,
+                self.status_error,
+                self.status_sub_error,
+                self.frost_protection_started,
+                main_state,
+                sub_state,
+                self.stove_temperature if main_state == 21 and sub_state == 12 else None,
+                self.eco_mode if main_state == 20 else False,
+            ))
+        return self._status
+
+
+# Payload values the status rules depend on; stove_temperature and eco_mode are only
+# kept for the main states whose rules read them, so the set of distinct inputs stays small
+StatusInputs = namedtuple(
+    'StatusInputs',
+    'offline warning error sub_error frost_started main_state sub_state stove_temperature eco_mode',
+)
+
 STATUS_RULES = [
     # Priority 1: Errors, connectivity, and critical warnings
-    (lambda s: s.get_last_seen_minutes() > 2,
-     lambda s: ["https://www.rika-firenet.com/images/status/Warning_WifiSignal.svg", "offline"]),
-    (lambda s: s.get_status_warning() == 2,
-     lambda s: ["https://www.rika-firenet.com/images/status/Any_Warning.svg", "pellet_lid_open"]),
-    (lambda s: s.get_status_error() == 1 and s.get_status_sub_error() == 1,
-     lambda s: ["https://raw.githubusercontent.com/antibill51/rika-firenet-custom-component/main/images/status/Visu_Error.svg", "Error"]),
-    (lambda s: s.get_status_error() == 1 and s.get_status_sub_error() == 2,
-     lambda s: ["https://raw.githubusercontent.com/antibill51/rika-firenet-custom-component/main/images/status/Visu_Empty.svg", "empty_tank"]),
-    (lambda s: s.get_status_error() == 8 and s.get_status_sub_error() == 16,
-     lambda s: ["https://raw.githubusercontent.com/antibill51/rika-firenet-custom-component/main/images/status/Visu_Error.svg", "not_ignited"]),
-    (lambda s: s.get_status_error() == 1,
-     lambda s: ["/", "statusSubError" + str(s.get_status_sub_error())]),
-    (lambda s: s.get_status_error() == 32768,
-     lambda s: ["https://raw.githubusercontent.com/antibill51/rika-firenet-custom-component/main/images/status/Visu_smoke_fan.svg", "smoke_fan"]),
-    (lambda s: s.is_frost_protection_started(),
-     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Freeze.svg", "frost_protection"]),
+    (lambda s: s.offline,
+     lambda s: ("https://www.rika-firenet.com/images/status/Warning_WifiSignal.svg", "offline")),
+    (lambda s: s.warning == 2,
+     lambda s: ("https://www.rika-firenet.com/images/status/Any_Warning.svg", "pellet_lid_open")),
+    (lambda s: s.error == 1 and s.sub_error == 1,
+     lambda s: ("https://raw.githubusercontent.com/antibill51/rika-firenet-custom-component/main/images/status/Visu_Error.svg", "Error")),
+    (lambda s: s.error == 1 and s.sub_error == 2,
+     lambda s: ("https://raw.githubusercontent.com/antibill51/rika-firenet-custom-component/main/images/status/Visu_Empty.svg", "empty_tank")),
+    (lambda s: s.error == 8 and s.sub_error == 16,
+     lambda s: ("https://raw.githubusercontent.com/antibill51/rika-firenet-custom-component/main/images/status/Visu_Error.svg", "not_ignited")),
+    (lambda s: s.error == 1,
+     lambda s: ("/", "statusSubError" + str(s.sub_error))),
+    (lambda s: s.error == 32768,
+     lambda s: ("https://raw.githubusercontent.com/antibill51/rika-firenet-custom-component/main/images/status/Visu_smoke_fan.svg", "smoke_fan")),
+    (lambda s: s.frost_started,
+     lambda s: ("https://www.rika-firenet.com/images/status/Visu_Freeze.svg", "frost_protection")),
 
     # Priority 2: Main operational states
-    (lambda s: s.get_main_state() == 1 and s.get_sub_state() == 0,
-     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Off.svg", "stove_off"]),
-    (lambda s: s.get_main_state() == 1 and s.get_sub_state() in [1, 2, 3],
-     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Standby.svg", "external_request" if s.get_sub_state() == 2 else "standby"]),
-    (lambda s: s.get_main_state() == 1,
-     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Off.svg", "sub_state_unknown"]),
-    (lambda s: s.get_main_state() == 2,
-     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Ignition.svg", "ignition_on"]),
-    (lambda s: s.get_main_state() == 3,
-     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Ignition.svg", "starting_up"]),
-    (lambda s: s.get_main_state() == 4,
-     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Control.svg", "running"]),
-    (lambda s: s.get_main_state() == 5 and s.get_sub_state() in [3, 4],
-     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Clean.svg", "big_clean"]),
-    (lambda s: s.get_main_state() == 5,
-     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Clean.svg", "clean"]),
-    (lambda s: s.get_main_state() == 6,
-     lambda s: ["https://www.rika-firenet.com/images/status/Visu_BurnOff.svg", "burn_off"]),
+    (lambda s: s.main_state == 1 and s.sub_state == 0,
+     lambda s: ("https://www.rika-firenet.com/images/status/Visu_Off.svg", "stove_off")),
+    (lambda s: s.main_state == 1 and s.sub_state in [1, 2, 3],
+     lambda s: ("https://www.rika-firenet.com/images/status/Visu_Standby.svg", "external_request" if s.sub_state == 2 else "standby")),
+    (lambda s: s.main_state == 1,
+     lambda s: ("https://www.rika-firenet.com/images/status/Visu_Off.svg", "sub_state_unknown")),
+    (lambda s: s.main_state == 2,
+     lambda s: ("https://www.rika-firenet.com/images/status/Visu_Ignition.svg", "ignition_on")),
+    (lambda s: s.main_state == 3,
+     lambda s: ("https://www.rika-firenet.com/images/status/Visu_Ignition.svg", "starting_up")),
+    (lambda s: s.main_state == 4,
+     lambda s: ("https://www.rika-firenet.com/images/status/Visu_Control.svg", "running")),
+    (lambda s: s.main_state == 5 and s.sub_state in [3, 4],
+     lambda s: ("https://www.rika-firenet.com/images/status/Visu_Clean.svg", "big_clean")),
+    (lambda s: s.main_state == 5,
+     lambda s: ("https://www.rika-firenet.com/images/status/Visu_Clean.svg", "clean")),
+    (lambda s: s.main_state == 6,
+     lambda s: ("https://www.rika-firenet.com/images/status/Visu_BurnOff.svg", "burn_off")),
 
     # Priority 3: Special modes (e.g., split log)
-    (lambda s: s.get_main_state() in [11, 13, 14, 16, 17, 50],
-     lambda s: ["https://www.rika-firenet.com/images/status/Visu_SpliLog.svg", "split_log_check"]),
-    (lambda s: s.get_main_state() == 21 and s.get_sub_state() == 12 and s.get_stove_temperature() is not None and 300 <= s.get_stove_temperature() <= 350,
-     lambda s: ["https://www.rika-firenet.com/images/status/Visu_SpliLog.svg", "split_log_refuel"]),
-    (lambda s: s.get_main_state() == 21 and s.get_sub_state() == 12 and s.get_stove_temperature() is not None and s.get_stove_temperature() < 300,
-     lambda s: ["https://www.rika-firenet.com/images/status/Visu_SpliLog.svg", "split_log_stop_refuel"]),
-    (lambda s: s.get_main_state() == 20 and s.is_stove_eco_mode(),
-     lambda s: ["https://www.rika-firenet.com/images/status/Visu_SpliLog.svg", "split_log_ecomode"]),
-    (lambda s: s.get_main_state() in [20, 21],
-     lambda s: ["https://www.rika-firenet.com/images/status/Visu_SpliLog.svg", "split_log_mode"]),
+    (lambda s: s.main_state in [11, 13, 14, 16, 17, 50],
+     lambda s: ("https://www.rika-firenet.com/images/status/Visu_SpliLog.svg", "split_log_check")),
+    (lambda s: s.main_state == 21 and s.sub_state == 12 and s.stove_temperature is not None and 300 <= s.stove_temperature <= 350,
+     lambda s: ("https://www.rika-firenet.com/images/status/Visu_SpliLog.svg", "split_log_refuel")),
+    (lambda s: s.main_state == 21 and s.sub_state == 12 and s.stove_temperature is not None and s.stove_temperature < 300,
+     lambda s: ("https://www.rika-firenet.com/images/status/Visu_SpliLog.svg", "split_log_stop_refuel")),
+    (lambda s: s.main_state == 20 and s.eco_mode,
+     lambda s: ("https://www.rika-firenet.com/images/status/Visu_SpliLog.svg", "split_log_ecomode")),
+    (lambda s: s.main_state in [20, 21],
+     lambda s: ("https://www.rika-firenet.com/images/status/Visu_SpliLog.svg", "split_log_mode")),
 ]
 
+@functools.lru_cache(maxsize=256)
+def lookup_status(inputs: StatusInputs):
+    """Return the status image and text key for a set of status inputs."""
+    for condition, result_func in STATUS_RULES:
+        if condition(inputs):
+            return result_func(inputs)
+    return ("https://www.rika-firenet.com/images/status/Visu_Off.svg", "unknown")
+
+
+# Snapshot fields read by the status rules
+STATUS_FIELDS = (
+    'last_seen_minutes', 'status_warning', 'status_error', 'status_sub_error', 'frost_protection_started',
+    'main_state', 'sub_state', 'stove_temperature', 'eco_mode',
+)
+
+# Stove getter -> snapshot fields its value is computed from, used to skip unchanged entity states
+GETTER_FIELDS = {
+    'is_stove_on': ('on_off',),
+    'get_room_temperature': ('room_temperature',),
+    'get_temperatureOffset': ('temperature_offset',),
+    'get_room_thermostat': ('target_temperature',),
+    'is_stove_eco_mode': ('eco_mode',),
+    'is_frost_protection': ('frost_protection',),
+    'get_stove_set_back_temperature': ('set_back_temperature',),
+    'is_stove_heating_times_on': ('operating_mode', 'heating_times_active_for_comfort'),
+    'get_room_power_request': ('room_power_request',),
+    'get_heating_power': ('heating_power',),
+    'is_stove_convection_fan1_on': ('convection_fan1_on',),
+    'get_convection_fan1_level': ('convection_fan1_level',),
+    'get_convection_fan1_area': ('convection_fan1_area',),
+    'is_stove_convection_fan2_on': ('convection_fan2_on',),
+    'get_convection_fan2_level': ('convection_fan2_level',),
+    'get_convection_fan2_area': ('convection_fan2_area',),
+    'get_hvac_mode': ('on_off', 'operating_mode', 'heating_times_active_for_comfort'),
+    'get_hvac_action': ('on_off', 'main_state', 'sub_state'),
+    'get_preset_mode': ('operating_mode',),
+    'is_stove_burning': ('main_state',),
+    'get_stove_consumption': ('consumption',),
+    'get_stove_runtime_pellets': ('runtime_pellets',),
+    'get_stove_runtime_logs': ('runtime_logs',),
+    'get_pellets_before_service': ('pellets_before_service',),
+    'get_stove_temperature': ('stove_temperature',),
+    'get_diag_motor': ('diag_motor',),
+    'get_fan_velocity': ('fan_velocity',),
+    'get_status_text': STATUS_FIELDS,
+    'get_status_picture': STATUS_FIELDS,
+    'get_main_state': ('main_state',),
+    'get_sub_state': ('sub_state',),
+    'get_status_error': ('status_error',),
+    'get_status_sub_error': ('status_sub_error',),
+    'get_status_warning': ('status_warning',),
+    'get_outputAirFlaps': ('output_air_flaps',),
+    'get_frost_protection_temperature': ('frost_protection_temperature',),
+}
+
+
+def get_state_fields(*getters):
+    """Returns the snapshot fields the given stove getters read, or None if one of them is not a snapshot getter."""
+    fields = set()
+    for getter in getters:
+        if getter not in GETTER_FIELDS:
+            return None
+        fields.update(GETTER_FIELDS[getter])
+    return frozenset(fields)
+
+
 class RikaFirenetStove:
     def __init__(self, coordinator, stove_id, name):
         self._coordinator = coordinator
         self._id = stove_id
         self._name = name
         self._state = None
-        self._controls_changed = False # Change indicator for this stove
+        self._payload = None # Last status payload received, without the local changes; persisted in the snapshot
+        self._restored = False # State restored from the snapshot, not confirmed by the stove yet
+        self._snapshot = RikaFirenetStoveSnapshot()
+        self._changed_fields = set(SNAPSHOT_FIELDS) # Fields changed since listeners were last notified
+        self._pending_controls = {} # Controls changed locally and not yet sent, in write order
+        self._sending_controls = {} # Controls of the write in flight
+        self._confirmed_controls = {} # Controls of the last payload or accepted write
 
     def __repr__(self):
         return f'Stove(id={self._id}, name={self._name})'
 
+    def _parse_state(self):
+        """Converts the current state into the snapshot read by the getters."""
+        self._replace_snapshot(RikaFirenetStoveSnapshot(self._state, self._id))
+
+    def _replace_snapshot(self, snapshot):
+        self._changed_fields |= snapshot.changed_fields(self._snapshot)
+        self._snapshot = snapshot
+
+    def pop_changed_fields(self):
+        """Returns the snapshot fields changed since the last call and resets them."""
+        changed_fields = self._changed_fields
+        self._changed_fields = set()
+        return changed_fields
+
     def update_internal_state(self, new_state):
-        """Updates the stove's internal state."""
+        """Updates the stove's internal state, keeping controls that are still pending."""
+        self._payload = trim_stove_state(new_state)
+        self._restored = False
+        new_state = dict(self._payload)
+        if 'controls' in new_state:
+            self._confirmed_controls = dict(new_state['controls'])
+            new_state['controls'] = {**new_state['controls'], **self._pending_controls}
         self._state = new_state
+        self._parse_state()
+
+    def restore_state(self, payload):
+        """Serves a payload persisted in the snapshot until the stove sends a fresh one.
+
+        Its controls are only displayed, not taken as confirmed: a command is never skipped as unchanged
+        because of them, and the stove is synced before they are sent.
+        """
+        self._payload = trim_stove_state(payload)
+        self._restored = True
+        self._state = dict(self._payload)
+        if 'controls' in self._state:
+            self._state['controls'] = dict(self._state['controls'])
+        self._parse_state()
+
+    def is_restored(self):
+        """True until the stove sends a payload after its state was restored from the snapshot."""
+        return self._restored
+
+    def get_payload(self):
+        """Returns the last payload received from the stove, without the controls changed locally."""
+        return self._payload
+
+    def apply_accepted_controls(self, controls):
+        """Merges controls accepted by the API into the state without fetching it again."""
+        if not self._state or 'controls' not in self._state:
+            return
+        self._state['controls'].update(controls)
+        self._confirmed_controls.update(controls)
+        self._state['controls'].update(self._pending_controls)
+        # The stove bumped its revision, the next write has to fetch it
+        self._state['controls'].pop('revision', None)
+        self._parse_state()
+
+    def get_unconfirmed_controls(self):
+        """Returns the controls changed locally that the stove has not accepted yet, in flight or pending."""
+        return {**self._sending_controls, **self._pending_controls}
+
+    def get_pending_controls(self):
+        """Returns a copy of the controls changed locally and not yet sent."""
+        return dict(self._pending_controls)
 
     def has_pending_changes(self):
         """Checks if there are pending control changes to be sent."""
-        return self._controls_changed
-
-    def clear_pending_changes(self):
-        """Resets the pending changes indicator."""
-        self._controls_changed = False
-
-    def _mark_controls_changed(self):
-        """Marks that controls have been modified and should be sent."""
-        self._controls_changed = True
-        _LOGGER.debug(f"Controls marked changed for stove {self._id}")
+        return bool(self._pending_controls)
+
+    def pop_pending_changes(self):
+        """Returns the pending changes and resets them."""
+        pending_controls = self._pending_controls
+        self._pending_controls = {}
+        self._sending_controls = pending_controls
+        return pending_controls
+
+    def confirm_sent_controls(self):
+        """The write in flight was accepted."""
+        self._sending_controls = {}
+
+    def restore_pending_changes(self, controls):
+        """Puts back changes that could not be sent; newer changes to the same keys win."""
+        self._pending_controls = {**controls, **self._pending_controls}
+        self._sending_controls = {}
+
+    def _mark_controls_changed(self, controls: dict):
+        """Marks that controls have been modified and should be sent.
+
+        A control set back to its last confirmed value needs no write, unless a write in flight changes it.
+        """
+        for key, value in controls.items():
+            if (
+                key in self._confirmed_controls
+                and key not in self._sending_controls
+                and _same_control_value(value, self._confirmed_controls[key])
+            ):
+                self._pending_controls.pop(key, None)
+            else:
+                self._pending_controls[key] = value
+        _LOGGER.debug(f"Controls marked changed for stove {self._id}: {list(controls)}, pending: {list(self._pending_controls)}")
 
     def _set_control(self, key: str, value):
         """Helper to set a control value and mark for update."""
-        _LOGGER.debug(f"Setting control '{key}' to '{value}' for stove {self._id}")
-        if self._state and 'controls' in self._state:
-            self._state['controls'][key] = value
-            self._mark_controls_changed()
-        else:
-            _LOGGER.warning(f"Cannot set control '{key}': stove state not available for stove {self._id}.")
+        self._set_controls({key: value})
 
     def _set_controls(self, controls_to_set: dict):
-        """Helper to set multiple control values and mark for update."""
-        _LOGGER.debug(f"Setting multiple controls: {controls_to_set} for stove {self._id}")
+        """Helper to set control values requested from Home Assistant and mark them for update."""
+        # A newer command replaces the one queued before the restart for the same controls
+        self._coordinator.discard_replayed_controls(self._id, controls_to_set)
+        self._apply_controls(controls_to_set)
+
+    def replay_controls(self, controls: dict):
+        """Sets controls queued before a restart and marks them for update."""
+        self._apply_controls(controls)
+
+    def _apply_controls(self, controls_to_set: dict):
+        _LOGGER.debug(f"Setting controls: {controls_to_set} for stove {self._id}")
         if self._state and 'controls' in self._state:
             for key, value in controls_to_set.items():
                 self._state['controls'][key] = value
-            self._mark_controls_changed()
+            self._replace_snapshot(self._snapshot.with_controls(self._state['controls'], self._id))
+            self._mark_controls_changed(controls_to_set)
         else:
             _LOGGER.warning(f"Cannot set controls: stove state not available for stove {self._id}.")
 
-    def sync_state(self):
+    async def sync_state(self):
         _LOGGER.debug(f"Syncing state for stove {self._id}")
         try:
-            new_state = self._coordinator.get_stove_state(self._id)
+            new_state = await self._coordinator.get_stove_state(self._id, max_age=STATUS_CACHE_TTL)
             if new_state is not None:
-                self._state = new_state
+                self.update_internal_state(new_state)
             else:
                 # Keep the old state if retrieval fails to avoid losing info
                 _LOGGER.warning(f"Failed to sync state for stove {self._id}; state remains: {self._state is not None}")
@@ -456,9 +1707,7 @@ class RikaFirenetStove:
         return None # Return None if state or controls are not available
 
     def is_stove_on(self):
-        if self._state and 'controls' in self._state and 'onOff' in self._state['controls']:
-            return bool(self._state['controls']['onOff'])
-        return False # By default, consider off if info is not present
+        return self._snapshot.on_off
 
     def get_id(self):
         return self._id
@@ -468,99 +1717,52 @@ class RikaFirenetStove:
 
     def get_state(self):
         return self._state
-    
-    # Add checks for all get_* methods accessing self._state
-    # Example for get_room_temperature:
+
+    # Values are converted once per payload by RikaFirenetStoveSnapshot
     def get_room_temperature(self):
-        if self._state and 'sensors' in self._state and 'inputRoomTemperature' in self._state['sensors']:
-            try:
-                return float(self._state['sensors']['inputRoomTemperature'])
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid room temperature value for {self._id}: {self._state['sensors']['inputRoomTemperature']}")
-                return None
-        return None
+        return self._snapshot.room_temperature
 
     def get_temperatureOffset(self):
-        if self._state and 'controls' in self._state and 'temperatureOffset' in self._state['controls']:
-            value = self._state['controls']['temperatureOffset']
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid temperatureOffset value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.temperature_offset
 
     def get_room_thermostat(self):
-        if self._state and 'controls' in self._state and 'targetTemperature' in self._state['controls']:
-            value = self._state['controls']['targetTemperature']
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid targetTemperature value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.target_temperature
 
     def is_stove_eco_mode(self):
-        return bool(self._state.get('controls', {}).get('ecoMode')) if self._state else False
+        return self._snapshot.eco_mode
 
     def is_frost_protection(self):
-        return bool(self._state.get('controls', {}).get('frostProtectionActive')) if self._state else False
+        return self._snapshot.frost_protection
 
     def is_frost_protection_started(self):
-        return bool(self._state.get('sensors', {}).get('statusFrostStarted', False)) if self._state else False
+        return self._snapshot.frost_protection_started
 
     def get_last_seen_minutes(self):
-        if self._state and 'lastSeenMinutes' in self._state:
-            try:
-                return int(self._state['lastSeenMinutes'])
-            except (ValueError, TypeError):
-                return 99 # Return a high value to indicate an issue
-        return 99 # Default to a high value if not present
+        return self._snapshot.last_seen_minutes
 
     def get_stove_set_back_temperature(self):
-        if self._state and 'controls' in self._state and 'setBackTemperature' in self._state['controls']:
-            value = self._state['controls']['setBackTemperature']
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid setBackTemperature value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.set_back_temperature
 
     def get_stove_operation_mode(self):
-        return self._state.get('controls', {}).get('operatingMode') if self._state else None
+        return self._snapshot.operating_mode
 
     def is_stove_heating_times_on(self):
-        op_mode = self.get_stove_operation_mode()
+        op_mode = self._snapshot.operating_mode
         if op_mode == 1: # Auto mode is always considered "heating times on"
             return True
         if op_mode == 2: # Comfort mode depends on the specific flag
-            return self.is_heating_times_active_for_comfort()
+            return self._snapshot.heating_times_active_for_comfort
         # Covers op_mode 0 (Manual), None, or any other unexpected value
         return False
 
     def is_heating_times_active_for_comfort(self):
-        return bool(self._state.get('controls', {}).get('heatingTimesActiveForComfort')) if self._state else False
+        return self._snapshot.heating_times_active_for_comfort
 
     def get_room_power_request(self):
-        if self._state and 'controls' in self._state and 'RoomPowerRequest' in self._state['controls']:
-            value = self._state['controls']['RoomPowerRequest']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid RoomPowerRequest value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.room_power_request
 
     def get_heating_power(self):
-        if self._state and 'controls' in self._state and 'heatingPower' in self._state['controls']:
-            value = self._state['controls']['heatingPower']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid heatingPower value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.heating_power
 
     def set_hvac_mode(self, hvac_mode):
         if hvac_mode == HVACMode.OFF:
@@ -588,256 +1790,119 @@ class RikaFirenetStove:
                 self.set_stove_operation_mode(0)
 
     def is_stove_convection_fan1_on(self):
-        return bool(self._state.get('controls', {}).get('convectionFan1Active')) if self._state else False
+        return self._snapshot.convection_fan1_on
 
     def get_convection_fan1_level(self):
-        if self._state and 'controls' in self._state and 'convectionFan1Level' in self._state['controls']:
-            value = self._state['controls']['convectionFan1Level']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid convectionFan1Level value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.convection_fan1_level
 
     def get_convection_fan1_area(self):
-        if self._state and 'controls' in self._state and 'convectionFan1Area' in self._state['controls']:
-            value = self._state['controls']['convectionFan1Area']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid convectionFan1Area value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.convection_fan1_area
 
     def is_stove_convection_fan2_on(self):
-        return bool(self._state.get('controls', {}).get('convectionFan2Active')) if self._state else False
+        return self._snapshot.convection_fan2_on
 
     def get_convection_fan2_level(self):
-        if self._state and 'controls' in self._state and 'convectionFan2Level' in self._state['controls']:
-            value = self._state['controls']['convectionFan2Level']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid convectionFan2Level value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.convection_fan2_level
 
     def get_convection_fan2_area(self):
-        if self._state and 'controls' in self._state and 'convectionFan2Area' in self._state['controls']:
-            value = self._state['controls']['convectionFan2Area']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid convectionFan2Area value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.convection_fan2_area
 
     def get_hvac_mode(self): # Must be based on the current state
-        if not self.is_stove_on(): # Uses the method that checks self._state
+        if not self._snapshot.on_off:
             return HVACMode.OFF
-        elif self.is_stove_heating_times_on(): # Uses the method that checks self._state
+        elif self.is_stove_heating_times_on():
             return HVACMode.AUTO
         # If on but not in AUTO mode (scheduled), then it's HEAT (manual)
         return HVACMode.HEAT
 
     def get_hvac_action(self) -> HVACAction:
         """Return current operation ie. heat, cool, idle."""
+        snapshot = self._snapshot
         # First, check if the stove is commanded to be off. This is the most reliable state.
-        if not self._state or not self._state.get('controls', {}).get('onOff'):
+        if not snapshot.on_off:
             return HVACAction.OFF
 
-        main_state = self.get_main_state()
-        sub_state = self.get_sub_state()
-
-        # States indicating active heating (ignition, running, split log mode)
-        HEATING_STATES = [2, 3, 4, 11, 13, 14, 16, 17, 20, 21, 50]
-        # States indicating the stove is on but not actively producing heat (standby, cleaning, burn-off)
-        IDLE_STATES = [5, 6]
+        main_state = snapshot.main_state
 
-        if main_state in HEATING_STATES:
+        if main_state in HEATING_MAIN_STATES:
             return HVACAction.HEATING
-        elif main_state in IDLE_STATES:
+        elif main_state in IDLE_MAIN_STATES:
             return HVACAction.IDLE
         elif main_state == 1:  # Special handling for standby/off states
-            if sub_state == 0:  # Explicitly off
+            if snapshot.sub_state == 0:  # Explicitly off
                 return HVACAction.OFF
             return HVACAction.IDLE # Other sub-states are standby
         return HVACAction.OFF # Default for unknown or off states
 
     def get_preset_mode(self):
         """Return the current preset mode."""
-        op_mode = self.get_stove_operation_mode()
-        return PRESET_COMFORT if op_mode == 2 else PRESET_NONE
+        return PRESET_COMFORT if self._snapshot.operating_mode == 2 else PRESET_NONE
 
     def is_stove_burning(self):
-        return self.get_main_state() in [4, 5]
+        return self._snapshot.main_state in (4, 5)
 
     def get_stove_consumption(self):
-        if self._state and 'sensors' in self._state and 'parameterFeedRateTotal' in self._state['sensors']:
-            value = self._state['sensors']['parameterFeedRateTotal']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid parameterFeedRateTotal value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.consumption
 
     def get_stove_runtime_pellets(self):
-        if self._state and 'sensors' in self._state and 'parameterRuntimePellets' in self._state['sensors']:
-            value = self._state['sensors']['parameterRuntimePellets']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid parameterRuntimePellets value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.runtime_pellets
 
     def get_stove_runtime_logs(self):
-        if self._state and 'sensors' in self._state and 'parameterRuntimeLogs' in self._state['sensors']:
-            value = self._state['sensors']['parameterRuntimeLogs']
-            try:
-                return int(value) // 60
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid parameterRuntimeLogs value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.runtime_logs
 
     def get_pellets_before_service(self):
-        if self._state and 'sensors' in self._state and 'parameterFeedRateService' in self._state['sensors']:
-            value = self._state['sensors']['parameterFeedRateService']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid parameterFeedRateService value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.pellets_before_service
 
     def get_stove_temperature(self):
-        if self._state and 'sensors' in self._state and 'inputFlameTemperature' in self._state['sensors']:
-            value = self._state['sensors']['inputFlameTemperature']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid inputFlameTemperature value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.stove_temperature
 
     def get_diag_motor(self):
-        if self._state and 'sensors' in self._state and 'outputDischargeMotor' in self._state['sensors']:
-            value = self._state['sensors']['outputDischargeMotor']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid outputDischargeMotor value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.diag_motor
 
     def get_fan_velocity(self):
-        if self._state and 'sensors' in self._state and 'outputIDFan' in self._state['sensors']:
-            value = self._state['sensors']['outputIDFan']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid outputIDFan value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.fan_velocity
 
     def get_status_text(self):
         return self.get_status()[1]
 
     def get_status_picture(self):
         return self.get_status()[0]
-    
+
     def get_main_state(self):
-        if self._state and 'sensors' in self._state and 'statusMainState' in self._state['sensors']:
-            value = self._state['sensors']['statusMainState']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid statusMainState value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.main_state
 
     def get_sub_state(self):
-        if self._state and 'sensors' in self._state and 'statusSubState' in self._state['sensors']:
-            value = self._state['sensors']['statusSubState']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid statusSubState value for {self._id}: {value}")
-                return None
-        return None
-    
+        return self._snapshot.sub_state
+
     def get_status_error(self):
-        if self._state and 'sensors' in self._state and 'statusError' in self._state['sensors']:
-            value = self._state['sensors']['statusError']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid statusError value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.status_error
 
     def get_status_sub_error(self):
-        if self._state and 'sensors' in self._state and 'statusSubError' in self._state['sensors']:
-            value = self._state['sensors']['statusSubError']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid statusSubError value for {self._id}: {value}")
-                return None
-        return None
-    
+        return self._snapshot.status_sub_error
+
     def get_status_warning(self):
-        if self._state and 'sensors' in self._state and 'statusWarning' in self._state['sensors']:
-            value = self._state['sensors']['statusWarning']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid statusWarning value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.status_warning
 
     def get_outputAirFlaps(self):
-        if self._state and 'sensors' in self._state and 'outputAirFlaps' in self._state['sensors']:
-            value = self._state['sensors']['outputAirFlaps']
-            try:
-                return float(value) / 10.0
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid outputAirFlaps value for {self._id}: {value}")
-                return None
-        return None
-    
+        return self._snapshot.output_air_flaps
+
     def is_airFlapsPossible(self):
-        return bool(self._state.get('stoveFeatures', {}).get('airFlaps')) if self._state else False
+        return self._snapshot.air_flaps_possible
 
     def is_logRuntimePossible(self):
-        return bool(self._state.get('stoveFeatures', {}).get('logRuntime')) if self._state else False
+        return self._snapshot.log_runtime_possible
 
     def is_multiAir1(self):
-        return bool(self._state.get('stoveFeatures', {}).get('multiAir1')) if self._state else False
+        return self._snapshot.multi_air1
 
     def is_multiAir2(self):
-        return bool(self._state.get('stoveFeatures', {}).get('multiAir2')) if self._state else False
+        return self._snapshot.multi_air2
 
     def get_frost_protection_temperature(self):
-        if self._state and 'controls' in self._state and 'frostProtectionTemperature' in self._state['controls']:
-            value = self._state['controls']['frostProtectionTemperature']
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Invalid frostProtectionTemperature value for {self._id}: {value}")
-                return None
-        return None
+        return self._snapshot.frost_protection_temperature
 
     def get_status(self):
         """Return the status image and text key based on a set of rules."""
         if not self._state:
-            return ["https://www.rika-firenet.com/images/status/Warning_WifiSignal.svg", "unavailable"]
-
-        for condition, result_func in STATUS_RULES:
-            if condition(self):
-                return result_func(self)
-
-        return ["https://www.rika-firenet.com/images/status/Visu_Off.svg", "unknown"]
+            return ("https://www.rika-firenet.com/images/status/Warning_WifiSignal.svg", "unavailable")
+        return self._snapshot.status
@@ -0,0 +1,82 @@
+import time
+from collections import deque
+from contextvars import ContextVar
+
+
+class CycleTrace:
+    """What happened during one poll cycle or control write: timings, HTTP calls and revisions."""
+
+    __slots__ = ("kind", "started", "_start", "duration", "result", "stoves", "calls")
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.started = time.time()
+        self._start = time.monotonic()
+        self.duration = None
+        self.result = None
+        self.stoves: dict[str, dict] = {}
+        # (offset from the cycle start, endpoint, stove id, latency, HTTP status or error)
+        self.calls: list[tuple] = []
+
+    def stove(self, stove_id):
+        """Per-stove details, created on first use."""
+        details = self.stoves.get(stove_id)
+        if details is None:
+            details = self.stoves[stove_id] = {"retries": 0}
+        return details
+
+    def add_call(self, endpoint, stove_id, latency, outcome):
+        self.calls.append((time.monotonic() - self._start - latency, endpoint, stove_id, latency, outcome))
+
+    def finish(self, result):
+        self.duration = time.monotonic() - self._start
+        self.result = result
+
+    def as_dict(self):
+        return {
+            "kind": self.kind,
+            "started": self.started,
+            "duration": round(self.duration, 3) if self.duration is not None else None,
+            "result": self.result,
+            "stoves": self.stoves,
+            "calls": [
+                {
+                    "offset": round(offset, 3),
+                    "endpoint": endpoint,
+                    "stove_id": stove_id,
+                    "latency": round(latency, 3),
+                    "outcome": outcome,
+                }
+                for offset, endpoint, stove_id, latency, outcome in self.calls
+            ],
+        }
+
+
+class CycleTracer:
+    """Keeps the traces of the last cycles in a bounded ring buffer.
+
+    The trace being recorded follows the asyncio tasks started from the cycle
+    through a context variable, so the HTTP helpers do not need it passed in.
+    Traces are only converted to dicts when the diagnostics are downloaded.
+    """
+
+    def __init__(self, size):
+        self._traces: deque[CycleTrace] = deque(maxlen=size)
+        self._current: ContextVar[CycleTrace | None] = ContextVar("rika_firenet_cycle_trace", default=None)
+
+    def start(self, kind):
+        """Start a trace in the current context; returns it with the token to pass to end()."""
+        trace = CycleTrace(kind)
+        self._traces.append(trace)
+        return trace, self._current.set(trace)
+
+    def end(self, trace, token, result):
+        trace.finish(result)
+        self._current.reset(token)
+
+    @property
+    def current(self):
+        return self._current.get()
+
+    def as_list(self):
+        return [trace.as_dict() for trace in self._traces]
@@ -0,0 +1,23 @@
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_PASSWORD, CONF_USERNAME, DOMAIN
+from .core import RikaFirenetCoordinator
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD}
+# Stove payload fields naming the stove
+PAYLOAD_TO_REDACT = {"name", "stoveID"}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Return diagnostics for a config entry."""
+    coordinator: RikaFirenetCoordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        # Built and redacted only when downloaded
+        "coordinator": async_redact_data(coordinator.get_diagnostics(), PAYLOAD_TO_REDACT),
+    }
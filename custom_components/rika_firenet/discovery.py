@@ -0,0 +1,99 @@
+import logging
+from html.parser import HTMLParser
+
+_LOGGER = logging.getLogger(__name__)
+
+STOVE_LIST_ID = "stoveList"
+
+
+class StoveListParser(HTMLParser):
+    """Extract (stove id, name) pairs from the ul#stoveList of the summary page.
+
+    Fed chunk by chunk while the page downloads; done is set once the list is
+    closed, so the rest of the page does not need to be read.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stoves: list[tuple[str, str]] = []
+        self.found = False
+        self.done = False
+        self._list_depth = 0 # Nesting level of <ul> inside the stove list, 0 when outside
+        self._item_has_link = False
+        self._link_href = None
+        self._link_text: list[str] = []
+        self._text_run: list[str] = [] # Text of the link since the last tag, arriving in pieces
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        self._end_text_run()
+        if tag == "ul":
+            if self._list_depth:
+                self._list_depth += 1
+            elif dict(attrs).get("id") == STOVE_LIST_ID:
+                self.found = True
+                self._list_depth = 1
+        elif not self._list_depth:
+            return
+        elif tag == "li":
+            self._item_has_link = False
+        elif tag == "a" and not self._item_has_link and self._link_href is None:
+            href = dict(attrs).get("href")
+            if href:
+                self._link_href = href
+                self._link_text = []
+
+    def handle_endtag(self, tag):
+        if not self._list_depth or self.done:
+            return
+        self._end_text_run()
+        if tag == "a" and self._link_href is not None:
+            self._add_stove(self._link_href, "".join(self._link_text).strip())
+            self._item_has_link = True
+            self._link_href = None
+        elif tag == "ul":
+            self._list_depth -= 1
+            if not self._list_depth:
+                self.done = True
+
+    def handle_data(self, data):
+        if self._link_href is not None:
+            self._text_run.append(data)
+
+    def _end_text_run(self):
+        # Whitespace-only text between tags counts as one newline or space, as in BeautifulSoup's .text
+        text = "".join(self._text_run)
+        self._text_run = []
+        if text and not text.strip():
+            text = "\n" if "\n" in text else " "
+        self._link_text.append(text)
+
+    def _add_stove(self, href, name):
+        stove_id = href.rsplit('/', 1)[-1]
+        if not stove_id:
+            _LOGGER.warning(f"Could not extract stove ID from link: {href}")
+            return
+        self.stoves.append((stove_id, name))
+
+
+def parse_stove_list_bs4(content):
+    """Fallback for markup the streaming parser could not follow."""
+    # Imported here: bs4 is slow to import and only needed if the summary page layout changes
+    from bs4 import BeautifulSoup
+
+    stoves = []
+    stove_list = BeautifulSoup(content, "html.parser").find("ul", {"id": STOVE_LIST_ID})
+    if not stove_list:
+        return stoves
+    for stove_item in stove_list.find_all('li'):
+        stove_link = stove_item.find('a', href=True)
+        if not stove_link or not stove_link.attrs['href']:
+            _LOGGER.warning(f"Could not find valid link in stove list item: {stove_item}")
+            continue
+        stove_id = stove_link.attrs['href'].rsplit('/', 1)[-1]
+        if not stove_id:
+            _LOGGER.warning(f"Could not extract stove ID from link: {stove_link.attrs['href']}")
+            continue
+        stoves.append((stove_id, stove_link.text.strip()))
+    return stoves
@@ -1,15 +1,40 @@
 import logging
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, NAME, DEFAULT_NAME, VERSION
+from .const import DOMAIN, NAME, DEFAULT_NAME, VERSION, SIGNAL_STOVES_ADDED
 from .core import RikaFirenetStove, RikaFirenetCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@callback
+def async_setup_stove_entities(hass, config_entry, async_add_entities, build_entities):
+    """Add a platform's entities for the current stoves, then for stoves found later by rediscovery.
+
+    build_entities takes a list of stoves and returns their entities.
+    """
+    coordinator: RikaFirenetCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    stove_entities = build_entities(coordinator.get_stoves())
+    if stove_entities:
+        async_add_entities(stove_entities, True)
+
+    @callback
+    def _async_add_stoves(stoves):
+        async_add_entities(build_entities(stoves), True)
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_STOVES_ADDED.format(entry_id=config_entry.entry_id), _async_add_stoves)
+    )
+
+
 class RikaFirenetEntity(CoordinatorEntity):
     """Base class for all Rika Firenet entities."""
 
+    # Snapshot fields the entity state is built from (see core.GETTER_FIELDS); None writes on every update
+    _state_fields = None
+
     def __init__(self, config_entry, stove: RikaFirenetStove, coordinator: RikaFirenetCoordinator, suffix=None):
         """Initialize the entity."""
         super().__init__(coordinator)
@@ -20,6 +45,7 @@ class RikaFirenetEntity(CoordinatorEntity):
         self._suffix = suffix
         self._name = f"{stove.get_name()} {suffix}" if suffix else stove.get_name()
         self._unique_id = self._generate_unique_id()
+        self._written_status = None # (available, stale) at the last state write
 
         _LOGGER.debug("Created RikaFirenetEntity: name=%s, unique_id=%s for stove_id=%s", self._name, self._unique_id, self._stove_id)
 
@@ -55,8 +81,31 @@ class RikaFirenetEntity(CoordinatorEntity):
             "sw_version": VERSION, # Integration version
         }
 
+    @property
+    def extra_state_attributes(self):
+        """Flag a state served from the last known payload while Rika Firenet does not answer."""
+        if not self.coordinator.is_stove_stale(self._stove_id):
+            return {"stale": False}
+        last_contact = self.coordinator.get_last_contact(self._stove_id)
+        return {
+            "stale": True,
+            "last_update": last_contact.isoformat() if last_contact else None,
+        }
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        # The stove is available if the coordinator is available and the stove has a state.
-        return super().available and self._stove.get_state() is not None
+        # The stove is available if the coordinator is available and served its state in the last update:
+        # stoves without a state or with a state older than STALE_STATE_MAX_AGE are left out of the data.
+        return super().available and self._stove_id in (self.coordinator.data or {})
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if a field it depends on, the availability or the staleness changed."""
+        written_status = (self.available, self.coordinator.is_stove_stale(self._stove_id))
+        if self._state_fields is not None and written_status == self._written_status:
+            changed_fields = self.coordinator.get_changed_fields(self._stove_id)
+            if changed_fields is not None and self._state_fields.isdisjoint(changed_fields):
+                return
+        self._written_status = written_status
+        super()._handle_coordinator_update()
@@ -1,12 +1,12 @@
 import logging
 
 from homeassistant.const import PERCENTAGE, UnitOfTemperature
-from .entity import RikaFirenetEntity
+from .entity import RikaFirenetEntity, async_setup_stove_entities
 from homeassistant.components.number import NumberEntity
 
 from .const import DOMAIN
 from .core import RikaFirenetCoordinator
-from .core import RikaFirenetStove
+from .core import RikaFirenetStove, get_state_fields
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,19 +48,20 @@ async def async_setup_entry(hass, entry, async_add_entities):
     _LOGGER.info("setting up platform number")
     coordinator: RikaFirenetCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    stove_entities = []
-    # Create 'number' entities for each stove
-    for stove in coordinator.get_stoves():
-        device_numbers_for_stove = get_number_device_list(stove)
-        stove_entities.extend(
-            [
-                RikaFirenetStoveNumber(entry, stove, coordinator, number)
-                for number in device_numbers_for_stove
-            ]
-        )
+    def build_entities(stoves):
+        stove_entities = []
+        # Create 'number' entities for each stove
+        for stove in stoves:
+            device_numbers_for_stove = get_number_device_list(stove)
+            stove_entities.extend(
+                [
+                    RikaFirenetStoveNumber(entry, stove, coordinator, number)
+                    for number in device_numbers_for_stove
+                ]
+            )
+        return stove_entities
 
-    if stove_entities:
-        async_add_entities(stove_entities, True)
+    async_setup_stove_entities(hass, entry, async_add_entities, build_entities)
 
 
 class RikaFirenetStoveNumber(RikaFirenetEntity, NumberEntity):
@@ -68,6 +69,8 @@ class RikaFirenetStoveNumber(RikaFirenetEntity, NumberEntity):
         super().__init__(config_entry, stove, coordinator, number)
         self._number = number
         self._config = NUMBER_CONFIG.get(self._number, {})
+        if self._config.get("command_get"):
+            self._state_fields = get_state_fields(self._config["command_get"])
 
     @property
     def native_min_value(self) -> float:
@@ -110,6 +113,7 @@ class RikaFirenetStoveNumber(RikaFirenetEntity, NumberEntity):
             _LOGGER.warning(f"No set command configured for number entity: {self._number}")
             return
         
-        # The methods above on self._stove mark _controls_changed = True
-        # Ask the coordinator to send the command and refresh
-        await self.coordinator.async_request_refresh()
+        # The methods above on self._stove mark the control as pending
+        # Ask the coordinator to send it, merged with other changes made in the same window
+        if not await self.coordinator.async_request_controls_update(self._stove):
+            _LOGGER.warning(f"Could not apply {self._number} for {self.name}, it will be retried on next update")
@@ -0,0 +1,66 @@
+import asyncio
+import logging
+import random
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RetryScheduler:
+    """Schedule retries on the event loop with exponential backoff and jitter.
+
+    Each key (a stove id) gets a retry budget per update cycle, and no retry is
+    started if its delay would run past the cycle deadline.
+    """
+
+    def __init__(self, base_delay, max_delay, budget):
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._budget = budget
+        self._deadline = None
+        self._used: dict[str, int] = {}
+        self._retries: dict[str, int] = {}
+        self._skipped: dict[str, int] = {}
+
+    def start_cycle(self, deadline=None):
+        """Reset the per-cycle budgets; deadline is a time.monotonic() value."""
+        self._used.clear()
+        self._deadline = deadline
+
+    def end_cycle(self):
+        self._deadline = None
+
+    def get_delay(self, attempt):
+        """Exponential backoff with 'equal jitter': half fixed, half random."""
+        delay = min(self._max_delay, self._base_delay * 2 ** attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def async_wait(self, key, attempt):
+        """Wait before retrying; return False if the retry must not happen."""
+        if self._used.get(key, 0) >= self._budget:
+            _LOGGER.debug(f"Retry budget exhausted for {key}")
+            self._skipped[key] = self._skipped.get(key, 0) + 1
+            return False
+
+        delay = self.get_delay(attempt)
+        if self._deadline is not None and time.monotonic() + delay >= self._deadline:
+            _LOGGER.debug(f"Not retrying {key}: the update cycle deadline would be exceeded")
+            self._skipped[key] = self._skipped.get(key, 0) + 1
+            return False
+
+        self._used[key] = self._used.get(key, 0) + 1
+        self._retries[key] = self._retries.get(key, 0) + 1
+        await asyncio.sleep(delay)
+        return True
+
+    def get_retry_count(self, key=None):
+        """Number of retries run, for one key or overall."""
+        if key is None:
+            return sum(self._retries.values())
+        return self._retries.get(key, 0)
+
+    def get_skipped_count(self, key=None):
+        """Number of retries refused because of the budget or the deadline."""
+        if key is None:
+            return sum(self._skipped.values())
+        return self._skipped.get(key, 0)
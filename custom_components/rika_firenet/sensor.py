@@ -3,9 +3,9 @@ from homeassistant.const import UnitOfTemperature, UnitOfTime, UnitOfMass, PERCE
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.components.sensor import SensorEntity, SensorStateClass, SensorDeviceClass
 
-from .entity import RikaFirenetEntity
+from .entity import RikaFirenetEntity, async_setup_stove_entities
 from .const import DOMAIN
-from .core import RikaFirenetCoordinator, RikaFirenetStove
+from .core import RikaFirenetCoordinator, RikaFirenetStove, get_state_fields
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,6 +44,10 @@ SENSOR_ATTRIBUTES = {
     "diag motor": {"unit": "‰","icon": "mdi:speedometer", "category": EntityCategory.DIAGNOSTIC,"command": "get_diag_motor"},
     "airflaps": {"unit": PERCENTAGE,"icon": "mdi:rotate-right", "category": EntityCategory.DIAGNOSTIC,"command": "get_outputAirFlaps"},
     "number fail": {"icon": "mdi:information-outline", "category": EntityCategory.DIAGNOSTIC,"command": "get_number_fail"},
+    "retries": {"icon": "mdi:repeat", "category": EntityCategory.DIAGNOSTIC, "coordinator_command": "get_retry_count", "state_class": SensorStateClass.TOTAL_INCREASING},
+    "status latency": {"unit": UnitOfTime.MILLISECONDS, "icon": "mdi:timer-sand", "category": EntityCategory.DIAGNOSTIC, "coordinator_command": "get_status_latency", "state_class": SensorStateClass.MEASUREMENT, "device_class": SensorDeviceClass.DURATION, "enabled_default": False},
+    "controls latency": {"unit": UnitOfTime.MILLISECONDS, "icon": "mdi:timer-sand", "category": EntityCategory.DIAGNOSTIC, "coordinator_command": "get_controls_latency", "state_class": SensorStateClass.MEASUREMENT, "device_class": SensorDeviceClass.DURATION, "enabled_default": False},
+    "request timeouts": {"icon": "mdi:timer-alert-outline", "category": EntityCategory.DIAGNOSTIC, "coordinator_command": "get_timeout_count", "state_class": SensorStateClass.TOTAL_INCREASING, "enabled_default": False},
     "main state": {"icon": "mdi:information-outline", "category": EntityCategory.DIAGNOSTIC,"command": "get_main_state"},
     "sub state": {"icon": "mdi:information-outline", "category": EntityCategory.DIAGNOSTIC,"command": "get_sub_state"},
     "statusError": {"icon": "mdi:information-outline", "category": EntityCategory.DIAGNOSTIC,"command": "get_status_error"},
@@ -63,6 +67,10 @@ BASE_DEVICE_SENSORS = [
     "fan velocity",
     "diag motor",
     "number fail",
+    "retries",
+    "status latency",
+    "controls latency",
+    "request timeouts",
     "main state",
     "sub state",
     "statusError",
@@ -86,19 +94,19 @@ async def async_setup_entry(hass, entry, async_add_entities):
     _LOGGER.info("Setting up platform sensor")
     coordinator: RikaFirenetCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    stove_entities = []
+    def build_entities(stoves):
+        stove_entities = []
+        for stove in stoves:
+            sensors_for_stove = get_sensor_device_list(stove)
+            stove_entities.extend(
+                [
+                    RikaFirenetStoveSensor(entry, stove, coordinator, sensor)
+                    for sensor in sensors_for_stove
+                ]
+            )
+        return stove_entities
 
-    for stove in coordinator.get_stoves():
-        sensors_for_stove = get_sensor_device_list(stove)
-        stove_entities.extend(
-            [
-                RikaFirenetStoveSensor(entry, stove, coordinator, sensor)
-                for sensor in sensors_for_stove
-            ]
-        )
-
-    if stove_entities:
-        async_add_entities(stove_entities, True)
+    async_setup_stove_entities(hass, entry, async_add_entities, build_entities)
 
 class RikaFirenetStoveSensor(RikaFirenetEntity, SensorEntity):
     """Représentation d'un capteur Rika Firenet."""
@@ -116,6 +124,9 @@ class RikaFirenetStoveSensor(RikaFirenetEntity, SensorEntity):
         self._attr_entity_category = sensor_attrs.get("category")
         self._attr_device_class = sensor_attrs.get("device_class")
         self._attr_state_class = sensor_attrs.get("state_class")
+        self._attr_entity_registry_enabled_default = sensor_attrs.get("enabled_default", True)
+        if sensor_attrs.get("command"):
+            self._state_fields = get_state_fields(sensor_attrs["command"])
 
     @property
     def native_value(self):
@@ -124,6 +135,10 @@ class RikaFirenetStoveSensor(RikaFirenetEntity, SensorEntity):
             # Special case for a coordinator-level sensor
             if self._sensor == "number fail":
                 return self.coordinator.get_number_fail()
+            # Retries and request stats kept by the coordinator per stove
+            coordinator_command = SENSOR_ATTRIBUTES.get(self._sensor, {}).get("coordinator_command")
+            if coordinator_command:
+                return getattr(self.coordinator, coordinator_command)(self._stove_id)
 
             # Get the command method name from attributes
             command = SENSOR_ATTRIBUTES.get(self._sensor, {}).get("command")
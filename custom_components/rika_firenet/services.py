@@ -0,0 +1,164 @@
+import asyncio
+import logging
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+
+from .climate import MAX_TEMP, MIN_TEMP
+from .const import DOMAIN
+from .number import NUMBER_CONFIG
+from .switch import SWITCH_CONFIG
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_SET_CONTROLS = "set_controls"
+
+# Service field -> SWITCH_CONFIG entry giving the stove commands for True and False.
+# Applied in this order: "on_off" comes after "heating_times", which also turns the stove on.
+SWITCH_FIELDS = {
+    "heating_times": "heating times",
+    "on_off": "on off",
+    "frost_protection": "frost protection",
+    "eco_mode": "eco mode",
+    "convection_fan1": "convection fan1",
+    "convection_fan2": "convection fan2",
+}
+
+# Service field -> NUMBER_CONFIG entry giving the range and the stove setter
+NUMBER_FIELDS = {
+    "heating_power": "heating power",
+    "room_power_request": "room power request",
+    "convection_fan1_level": "convection fan1 level",
+    "convection_fan1_area": "convection fan1 area",
+    "convection_fan2_level": "convection fan2 level",
+    "convection_fan2_area": "convection fan2 area",
+    "set_back_temperature": "set back temperature",
+    "frost_protection_temperature": "set frost protection temperature",
+    "temperature_offset": "temperature offset",
+}
+
+# Service field -> (stove setter, validator) for the controls without a number entity
+OTHER_FIELDS = {
+    "operating_mode": ("set_stove_operation_mode", vol.All(vol.Coerce(int), vol.In([0, 1, 2]))),
+    "target_temperature": ("set_stove_temperature", vol.All(vol.Coerce(float), vol.Range(min=MIN_TEMP, max=MAX_TEMP))),
+}
+
+
+def _number_validator(config):
+    return vol.All(vol.Coerce(int if config["int_value"] else float), vol.Range(min=config["min"], max=config["max"]))
+
+
+CONTROL_FIELDS = [*SWITCH_FIELDS, *OTHER_FIELDS, *NUMBER_FIELDS]
+
+SET_CONTROLS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            # All the stoves when omitted
+            vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+            **{vol.Optional(field): cv.boolean for field in SWITCH_FIELDS},
+            **{vol.Optional(field): validator for field, (_, validator) in OTHER_FIELDS.items()},
+            **{vol.Optional(field): _number_validator(NUMBER_CONFIG[key]) for field, key in NUMBER_FIELDS.items()},
+        }
+    ),
+    cv.has_at_least_one_key(*CONTROL_FIELDS),
+)
+
+
+def _find_stove(hass: HomeAssistant, device):
+    """Returns (coordinator, stove) for a stove device, or None if its entry is not loaded."""
+    stove_id = next(identifier for domain, identifier in device.identifiers if domain == DOMAIN)
+    for entry_id in device.config_entries:
+        coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+        if coordinator is None:
+            continue
+        for stove in coordinator.get_stoves():
+            if stove.get_id() == stove_id:
+                return coordinator, stove
+    return None
+
+
+def _get_stoves(hass: HomeAssistant, device_ids):
+    """Returns (coordinator, stove) for each targeted stove device, or for every loaded stove if device_ids is None."""
+    if device_ids is None:
+        return [
+            (coordinator, stove)
+            for coordinator in hass.data.get(DOMAIN, {}).values()
+            for stove in coordinator.get_stoves()
+        ]
+    device_registry = dr.async_get(hass)
+    targets = []
+    for device_id in device_ids:
+        device = device_registry.async_get(device_id)
+        if device is None or not any(domain == DOMAIN for domain, _ in device.identifiers):
+            raise ServiceValidationError(f"Device {device_id} is not a Rika Firenet stove")
+        target = _find_stove(hass, device)
+        if target is None:
+            raise ServiceValidationError(f"Stove {device.name} is not loaded")
+        targets.append(target)
+    return targets
+
+
+def apply_controls(stove, data):
+    """Sets the service fields present in data on the stove, without sending them."""
+    for field, switch in SWITCH_FIELDS.items():
+        if field in data:
+            method_name, *args = SWITCH_CONFIG[switch]["turn_on" if data[field] else "turn_off"]
+            getattr(stove, method_name)(*args)
+    for field, (method_name, _) in OTHER_FIELDS.items():
+        if field in data:
+            getattr(stove, method_name)(data[field])
+    for field, number in NUMBER_FIELDS.items():
+        if field in data:
+            getattr(stove, NUMBER_CONFIG[number]["command_set"])(data[field])
+
+
+async def _async_set_stove_controls(coordinator, stove, data):
+    """Apply the controls to one stove, sent in a single POST. Returns None or the error."""
+    _LOGGER.info(f"Setting controls {[field for field in CONTROL_FIELDS if field in data]} for stove {stove.get_id()}")
+    if not stove.get_control_state():
+        # The setters would not apply anything: this is not a no-op write
+        _LOGGER.warning(f"Cannot set controls for stove {stove.get_id()}: no state received from the stove yet")
+        return "no state received from the stove yet"
+    try:
+        apply_controls(stove, data)
+        if not await coordinator.async_request_controls_update(stove):
+            return "not accepted, will be retried on next update"
+    except Exception as e:
+        _LOGGER.error(f"Error setting controls for stove {stove.get_id()}: {e}", exc_info=True)
+        return str(e)
+    return None
+
+
+async def _async_set_controls(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Apply several controls at once to the targeted stoves: one POST per stove, all stoves in parallel."""
+    targets = _get_stoves(hass, call.data.get(ATTR_DEVICE_ID))
+    errors = await asyncio.gather(
+        *(_async_set_stove_controls(coordinator, stove, call.data) for coordinator, stove in targets)
+    )
+    report = {
+        stove.get_id(): {"name": stove.get_name(), "success": error is None, "error": error}
+        for (_, stove), error in zip(targets, errors)
+    }
+    if call.return_response:
+        return {"stoves": report}
+    failed = [f"{result['name']} ({result['error']})" for result in report.values() if not result["success"]]
+    if failed:
+        raise HomeAssistantError(f"Could not send the controls to {', '.join(failed)}")
+    return None
+
+
+def async_setup_services(hass: HomeAssistant):
+    async def async_handle_set_controls(call: ServiceCall) -> ServiceResponse:
+        return await _async_set_controls(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_CONTROLS,
+        async_handle_set_controls,
+        schema=SET_CONTROLS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
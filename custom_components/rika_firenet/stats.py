@@ -0,0 +1,114 @@
+import bisect
+import time
+
+# Upper bounds of the latency histogram buckets, in seconds; the last bucket counts slower requests
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+ENDPOINT_LOGIN = "login"
+ENDPOINT_SUMMARY = "summary"
+ENDPOINT_STATUS = "status"
+ENDPOINT_CONTROLS = "controls"
+
+
+class EndpointStats:
+    """Counters for the requests sent to one endpoint, for one stove or for the account."""
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "timeouts",
+        "retries",
+        "cancelled",
+        "bytes",
+        "latency_sum",
+        "last_latency",
+        "histogram",
+        "last_error",
+        "last_error_time",
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.retries = 0
+        self.cancelled = 0
+        self.bytes = 0
+        self.latency_sum = 0.0
+        self.last_latency = None
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.last_error = None
+        self.last_error_time = None
+
+    def as_dict(self):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "retries": self.retries,
+            "cancelled": self.cancelled,
+            "bytes": self.bytes,
+            "mean_latency": round(self.latency_sum / self.requests, 3) if self.requests else None,
+            "last_latency": round(self.last_latency, 3) if self.last_latency is not None else None,
+            "latency_histogram": {
+                **{f"<={bound}s": count for bound, count in zip(LATENCY_BUCKETS, self.histogram)},
+                f">{LATENCY_BUCKETS[-1]}s": self.histogram[-1],
+            },
+            "last_error": self.last_error,
+            "last_error_time": self.last_error_time,
+        }
+
+
+class RequestStats:
+    """Request counters per endpoint and per stove (None for account requests: login, summary)."""
+
+    def __init__(self):
+        self._stats: dict[tuple[str, str | None], EndpointStats] = {}
+
+    def _get(self, endpoint, stove_id):
+        key = (endpoint, stove_id)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = EndpointStats()
+        return stats
+
+    def record(self, endpoint, stove_id, latency, bytes_received=0, error=None, timeout=False):
+        """Record one request; error is a short description when it failed."""
+        stats = self._get(endpoint, stove_id)
+        stats.requests += 1
+        stats.bytes += bytes_received
+        stats.latency_sum += latency
+        stats.last_latency = latency
+        stats.histogram[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+        if timeout:
+            stats.timeouts += 1
+        if error is not None:
+            stats.errors += 1
+            stats.last_error = error
+            stats.last_error_time = time.time()
+
+    def record_cancelled(self, endpoint, stove_id):
+        """Record a request abandoned by the integration (cycle deadline, shutdown), neither a success nor an error."""
+        self._get(endpoint, stove_id).cancelled += 1
+
+    def record_retry(self, endpoint, stove_id):
+        self._get(endpoint, stove_id).retries += 1
+
+    def get(self, endpoint, stove_id=None):
+        """Counters for an endpoint and stove, or None if no request was recorded yet."""
+        return self._stats.get((endpoint, stove_id))
+
+    def get_timeouts(self, stove_id):
+        """Timeouts over all the endpoints of a stove."""
+        return sum(stats.timeouts for (_, key), stats in self._stats.items() if key == stove_id)
+
+    def forget_stove(self, stove_id):
+        for key in [key for key in self._stats if key[1] == stove_id]:
+            del self._stats[key]
+
+    def as_dict(self):
+        """{endpoint: {stove id or "account": counters}}"""
+        result = {}
+        for (endpoint, stove_id), stats in self._stats.items():
+            result.setdefault(endpoint, {})[stove_id or "account"] = stats.as_dict()
+        return result
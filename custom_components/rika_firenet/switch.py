@@ -1,8 +1,8 @@
 import logging
 from homeassistant.components.switch import SwitchEntity
-from .entity import RikaFirenetEntity
+from .entity import RikaFirenetEntity, async_setup_stove_entities
 from .const import DOMAIN
-from .core import RikaFirenetCoordinator, RikaFirenetStove
+from .core import RikaFirenetCoordinator, RikaFirenetStove, get_state_fields
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,19 +49,19 @@ async def async_setup_entry(hass, entry, async_add_entities):
     _LOGGER.info("Setting up platform switches")
     coordinator: RikaFirenetCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    stove_entities = []
+    def build_entities(stoves):
+        stove_entities = []
+        for stove in stoves:
+            switches_for_stove = get_switch_device_list(stove)
+            stove_entities.extend(
+                [
+                    RikaFirenetStoveSwitch(entry, stove, coordinator, switch_type)
+                    for switch_type in switches_for_stove
+                ]
+            )
+        return stove_entities
 
-    for stove in coordinator.get_stoves():
-        switches_for_stove = get_switch_device_list(stove)
-        stove_entities.extend(
-            [
-                RikaFirenetStoveSwitch(entry, stove, coordinator, switch_type)
-                for switch_type in switches_for_stove
-            ]
-        )
-
-    if stove_entities:
-        async_add_entities(stove_entities, True)
+    async_setup_stove_entities(hass, entry, async_add_entities, build_entities)
 
 
 class RikaFirenetStoveSwitch(RikaFirenetEntity, SwitchEntity):
@@ -69,6 +69,8 @@ class RikaFirenetStoveSwitch(RikaFirenetEntity, SwitchEntity):
         super().__init__(config_entry, stove, coordinator, switch_type)
         self._switch_type = switch_type
         self._config = SWITCH_CONFIG.get(self._switch_type, {})
+        if self._config.get("is_on"):
+            self._state_fields = get_state_fields(self._config["is_on"])
 
     @property
     def translation_key(self):
@@ -96,7 +98,8 @@ class RikaFirenetStoveSwitch(RikaFirenetEntity, SwitchEntity):
         method = getattr(self._stove, method_name)
         method(*args)
 
-        await self.coordinator.async_request_refresh()
+        if not await self.coordinator.async_request_controls_update(self._stove):
+            _LOGGER.warning("Could not apply '%s' for switch '%s', it will be retried on next update", command_key, self._switch_type)
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the entity on."""
@@ -0,0 +1,117 @@
+"""State transitions of CircuitBreaker."""
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from custom_components.rika_firenet.circuit_breaker import (  # noqa: E402
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def run(test):
+    """Run test(breaker, clock) with a clock moved by the test."""
+    clock = Clock()
+    with patch("custom_components.rika_firenet.circuit_breaker.time.monotonic", clock):
+        test(CircuitBreaker(failure_threshold=3, reset_timeout=60, max_reset_timeout=200), clock)
+
+
+def test_opens_after_threshold_failures():
+    def test(breaker, clock):
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == STATE_CLOSED
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == STATE_OPEN
+        assert not breaker.allow_request()
+
+    run(test)
+
+
+def test_success_resets_the_failure_count():
+    def test(breaker, clock):
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == STATE_CLOSED
+
+    run(test)
+
+
+def test_half_open_after_reset_timeout():
+    def test(breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 59
+        assert not breaker.allow_request()
+        assert breaker.state == STATE_OPEN
+        clock.now += 1
+        assert breaker.allow_request()
+        assert breaker.state == STATE_HALF_OPEN
+
+    run(test)
+
+
+def test_successful_probe_closes():
+    def test(breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 60
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == STATE_CLOSED
+        # The failures are counted from zero again
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == STATE_CLOSED
+
+    run(test)
+
+
+def test_failed_probe_reopens_with_doubled_timeout_up_to_the_max():
+    def test(breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        for timeout in (60, 120, 200, 200):
+            clock.now += timeout - 1
+            assert not breaker.allow_request()
+            clock.now += 1
+            assert breaker.allow_request()
+            assert breaker.state == STATE_HALF_OPEN
+            breaker.record_failure()
+            assert breaker.state == STATE_OPEN
+
+    run(test)
+
+
+def test_timeout_back_to_base_after_closing():
+    def test(breaker, clock):
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 60
+        breaker.allow_request()
+        breaker.record_failure()  # Re-opened for 120s
+        clock.now += 120
+        breaker.allow_request()
+        breaker.record_success()
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 60
+        assert breaker.allow_request()
+
+    run(test)
@@ -0,0 +1,315 @@
+"""Shutdown and control writes of RikaFirenetCoordinator.
+
+Needs a Home Assistant development environment (homeassistant and pytest installed):
+
+    python -m pytest tests
+"""
+import asyncio
+import copy
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tools"))
+
+import pytest  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers.storage import Store  # noqa: E402
+
+from custom_components.rika_firenet.circuit_breaker import STATE_HALF_OPEN, STATE_OPEN  # noqa: E402
+from custom_components.rika_firenet.const import STALE_STATE_MAX_AGE  # noqa: E402
+from custom_components.rika_firenet.core import (  # noqa: E402
+    RikaFirenetCoordinator,
+    RikaFirenetStove,
+    async_remove_entry_stores,
+)
+from fake_firenet import FakeFirenet  # noqa: E402
+
+# Status payload reduced to the fields the tests read, info.md documents a full one
+PAYLOAD = {
+    "lastSeenMinutes": 0,
+    "controls": {"revision": 1, "onOff": True, "operatingMode": 0, "heatingPower": 45, "RoomPowerRequest": 2},
+    "sensors": {"statusMainState": 4, "statusSubState": 1, "statusError": 0, "statusSubError": 0, "statusWarning": 0},
+}
+
+
+def run(test, fake=None):
+    """Run test(coordinator, stove) in a Home Assistant instance, with a stove known from a payload.
+
+    The coordinator talks to fake (a FakeFirenet) if given.
+    """
+
+    async def async_run():
+        runner, base_url = await fake.start() if fake is not None else (None, "http://localhost:1")
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(config_dir)
+            coordinator = RikaFirenetCoordinator(hass, "user", "password", 21, 15, base_url=base_url)
+            stove = RikaFirenetStove(coordinator, "10000", "Stove 1")
+            stove.update_internal_state(copy.deepcopy(PAYLOAD))
+            coordinator._stoves = [stove]
+            try:
+                await test(coordinator, stove)
+            finally:
+                await coordinator.async_shutdown()
+                await hass.async_stop(force=True)
+                if runner is not None:
+                    await runner.cleanup()
+
+    asyncio.run(async_run())
+
+
+def test_shutdown_closes_the_client_session():
+    async def test(coordinator, stove):
+        await coordinator.async_shutdown()
+        assert coordinator._client.closed
+
+    run(test)
+
+
+def test_changes_kept_when_the_send_raises():
+    async def test(coordinator, stove):
+        async def set_stove_controls(*args, **kwargs):
+            raise Exception("Failed to connect with Rika Firenet")
+
+        coordinator.set_stove_controls = set_stove_controls
+        stove.set_heating_power(80)
+        with pytest.raises(Exception, match="Failed to connect"):
+            await coordinator._async_send_pending_controls(stove)
+        assert stove.get_pending_controls() == {"heatingPower": 80}
+        assert stove.get_heating_power() == 80
+
+    run(test)
+
+
+def test_newer_command_wins_over_replayed_one():
+    async def test(coordinator, stove):
+        sent = []
+
+        async def get_stove_state(stove_id, *args, **kwargs):
+            return copy.deepcopy(stove.get_state())
+
+        async def set_stove_controls(stove_id, controls, fetch_state=True):
+            sent.append({key: controls[key] for key in ("heatingPower", "RoomPowerRequest")})
+            return controls
+
+        coordinator.get_stove_state = get_stove_state
+        coordinator.set_stove_controls = set_stove_controls
+        queued_at = time.time()
+        coordinator._commands_to_replay = {"10000": {"heatingPower": (40, queued_at), "RoomPowerRequest": (3, queued_at)}}
+
+        # Set after the restart, before the first poll replays the queue
+        stove.set_heating_power(70)
+        await coordinator.async_request_controls_update(stove)
+        async with coordinator._get_control_lock("10000"):
+            await coordinator._async_replay_commands(stove)
+
+        assert sent == [{"heatingPower": 70, "RoomPowerRequest": 2}, {"heatingPower": 70, "RoomPowerRequest": 3}]
+        assert stove.get_heating_power() == 70
+
+    run(test)
+
+
+def test_cancelled_request_stays_cancelled():
+    async def test(coordinator, stove):
+        coordinator._client.request = lambda *args, **kwargs: _SlowResponse()
+        trace, token = coordinator._tracer.start("poll")
+        try:
+            task = asyncio.create_task(_async_get(coordinator))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        finally:
+            coordinator._tracer.end(trace, token, "cancelled")
+        assert trace.calls[0][4] == "cancelled"
+        stats = coordinator.get_request_stats().get("status", "10000")
+        assert (stats.requests, stats.errors, stats.cancelled) == (0, 0, 1)
+
+    run(test)
+
+
+class _SlowResponse:
+    """Stands for a request that never gets its response."""
+
+    async def __aenter__(self):
+        await asyncio.sleep(10)
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+async def _async_get(coordinator):
+    async with coordinator._async_request("status", "10000", "GET", "http://localhost:1/status"):
+        pass
+
+
+def test_probe_failure_reopens_the_circuit_breaker():
+    async def test(coordinator, stove):
+        async def get_stove_state(*args, **kwargs):
+            raise Exception("Failed to connect with Rika Firenet")
+
+        coordinator.get_stove_state = get_stove_state
+        coordinator._circuit_breaker.state = STATE_HALF_OPEN
+        coordinator._last_contact["10000"] = time.monotonic() - 600
+        # The last known state is still served
+        assert "10000" in await coordinator.async_update_data()
+        assert coordinator._circuit_breaker.state == STATE_OPEN
+
+    run(test)
+
+
+def test_probe_logs_in_again_once():
+    async def test(coordinator, stove):
+        calls = []
+
+        async def get_stove_state(*args, **kwargs):
+            # The first answer is a rejected session, dropped from the cookie jar
+            calls.append(kwargs)
+            return copy.deepcopy(PAYLOAD) if len(calls) > 1 else None
+
+        coordinator.get_stove_state = get_stove_state
+        assert await coordinator._async_probe()
+        assert calls == [{"max_attempts": 1}, {"max_attempts": 1}]
+
+    run(test)
+
+
+def test_set_controls_reports_stove_without_state():
+    async def test(coordinator, stove):
+        from custom_components.rika_firenet.services import _async_set_stove_controls
+
+        stove_without_state = RikaFirenetStove(coordinator, "10001", "Stove 2")
+        error = await _async_set_stove_controls(coordinator, stove_without_state, {"heating_power": 60})
+        assert error == "no state received from the stove yet"
+        assert "10001" not in coordinator._suppressed_writes
+
+    run(test)
+
+
+def test_apply_controls_returns_when_the_write_fails():
+    async def test(coordinator, stove):
+        async def set_stove_controls(*args, **kwargs):
+            return None
+
+        coordinator.set_stove_controls = set_stove_controls
+        stove.set_heating_power(80)
+        start = time.monotonic()
+        assert await coordinator.async_apply_controls(stove, timeout=5) is False
+        assert time.monotonic() - start < 2
+        assert not coordinator._confirmation_waiters
+        assert stove.get_pending_controls() == {"heatingPower": 80}
+
+    run(test)
+
+
+def test_apply_controls_confirmed_by_the_next_payload():
+    fake = FakeFirenet()
+
+    async def test(coordinator, stove):
+        await stove.sync_state()
+        fake.reset_stats()
+        stove.set_heating_power(80)
+        assert await coordinator.async_apply_controls(stove, timeout=5)
+        assert (fake.stats["controls"]["requests"], fake.stats["status"]["requests"]) == (1, 1)
+
+    run(test, fake)
+
+
+def test_accepted_write_does_not_confirm_itself():
+    fake = FakeFirenet()
+
+    async def test(coordinator, stove):
+        await stove.sync_state()
+        # Accepted, but the stove neither applies the controls nor bumps its revision
+        fake.stoves["10000"].apply_controls = lambda controls: None
+        stove.set_heating_power(80)
+        assert await coordinator.async_apply_controls(stove, timeout=1) is False
+
+    run(test, fake)
+
+
+def test_snapshot_saved_while_polling_faster_than_the_save_delay():
+    async def test(coordinator, stove):
+        coordinator._snapshot_store = Store(coordinator.hass, 1, "rika_firenet.test.snapshot")
+        with patch("custom_components.rika_firenet.core.SNAPSHOT_SAVE_DELAY", 0.2):
+            for _ in range(6):
+                coordinator._async_schedule_snapshot_save()
+                await asyncio.sleep(0.1)
+        # Written to disk, not only pending in the store
+        assert os.path.exists(coordinator.hass.config.path(".storage", "rika_firenet.test.snapshot"))
+
+    run(test)
+
+
+def test_restored_controls_are_not_taken_as_confirmed():
+    async def test(coordinator, stove):
+        sent = []
+
+        async def get_stove_state(stove_id, *args, **kwargs):
+            payload = copy.deepcopy(PAYLOAD)
+            payload["controls"]["revision"] = 2
+            return payload
+
+        async def set_stove_controls(stove_id, controls, fetch_state=True):
+            sent.append(dict(controls))
+            return controls
+
+        coordinator._snapshot_store = Store(coordinator.hass, 1, "rika_firenet.test.snapshot")
+        coordinator._last_contact["10000"] = time.monotonic()
+        stove.set_heating_power(80)
+        await coordinator._snapshot_store.async_save(coordinator._snapshot_data())
+
+        assert await coordinator._async_restore_snapshot()
+        restored = coordinator.get_stoves()[0]
+        # The stove never confirmed the change
+        assert restored.get_heating_power() == 45
+        restored.set_heating_power(80)
+        assert restored.get_pending_controls() == {"heatingPower": 80}
+
+        # Sent on top of a fresh payload, not of the restored controls
+        coordinator.get_stove_state = get_stove_state
+        coordinator.set_stove_controls = set_stove_controls
+        assert await coordinator._async_send_pending_controls(restored)
+        assert (sent[0]["heatingPower"], sent[0]["revision"]) == (80, 2)
+
+    run(test)
+
+
+def test_too_old_snapshot_not_restored():
+    async def test(coordinator, stove):
+        coordinator._snapshot_store = Store(coordinator.hass, 1, "rika_firenet.test.snapshot")
+        coordinator._last_contact["10000"] = time.monotonic() - STALE_STATE_MAX_AGE - 60
+        await coordinator._snapshot_store.async_save(coordinator._snapshot_data())
+
+        assert not await coordinator._async_restore_snapshot()
+
+    run(test)
+
+
+def test_no_save_outlives_the_removed_entry():
+    async def test(coordinator, stove):
+        hass = coordinator.hass
+        entry_coordinator = RikaFirenetCoordinator(hass, "user", "password", 21, 15, entry_id="e1")
+        entry_stove = RikaFirenetStove(entry_coordinator, "10000", "Stove 1")
+        entry_stove.update_internal_state(copy.deepcopy(PAYLOAD))
+        entry_coordinator._stoves = [entry_stove]
+        entry_coordinator._last_contact["10000"] = time.monotonic()
+        entry_coordinator._async_schedule_snapshot_save()
+        entry_stove.set_heating_power(80)
+        entry_coordinator._async_queue_commands(entry_stove)
+        paths = [hass.config.path(".storage", f"rika_firenet.e1.{name}") for name in ("snapshot", "command_queue")]
+
+        # Written at shutdown instead of being left pending
+        await entry_coordinator.async_shutdown()
+        assert all(os.path.exists(path) for path in paths)
+
+        # A late poll of the unloaded coordinator
+        entry_coordinator._async_schedule_snapshot_save()
+        await async_remove_entry_stores(hass, "e1")
+        await hass.async_block_till_done()
+        assert not any(os.path.exists(path) for path in paths)
+
+    run(test)
@@ -0,0 +1,149 @@
+"""Stove list of the summary page: the streaming StoveListParser against the BeautifulSoup fallback."""
+import asyncio
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tools"))
+
+import pytest  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.rika_firenet.const import DISCOVERY_MISSES_BEFORE_REMOVAL  # noqa: E402
+from custom_components.rika_firenet.core import RikaFirenetCoordinator  # noqa: E402
+from custom_components.rika_firenet.discovery import StoveListParser, parse_stove_list_bs4  # noqa: E402
+from fake_firenet import FakeFirenet, FakeStove  # noqa: E402
+
+PAGES = {
+    "fake server": (
+        '<html><body><ul id="stoveList"><li><a href="/web/stove/10000">Stove 1</a></li>'
+        '<li><a href="/web/stove/10001">Stove 2</a></li></ul><a href="/web/logout">Logout</a></body></html>'
+    ),
+    "summary layout": """<!DOCTYPE html>
+<html>
+<head><title>RIKA firenet</title></head>
+<body>
+  <ul class="nav"><li><a href="/web/summary">Summary</a></li><li><a href="/web/logout">Logout</a></li></ul>
+  <div data-role="content">
+    <ul id="stoveList" data-role="listview" data-inset="true">
+      <li data-icon="false">
+        <a href="/web/stove/12345678" data-transition="slide">
+          <img src="/images/stove.png" alt="">
+          <h3>Salon &amp; Cuisine</h3>
+          <p class="status">running</p>
+        </a>
+        <a href="/web/stove/12345678/settings">Settings</a>
+      </li>
+      <li><a href="/web/stove/87654321"><span>Bureau</span> &eacute;tage</a></li>
+    </ul>
+  </div>
+  <ul><li><a href="/web/help">Help</a></li></ul>
+</body>
+</html>""",
+    "items without a usable link": (
+        '<ul id="stoveList"><li>No stove yet</li><li><a href="">Empty</a></li>'
+        '<li><a href="/web/stove/">No id</a></li><li><a href="/web/stove/42">Kept</a></li></ul>'
+    ),
+    "nested list": (
+        '<ul id="stoveList"><li><a href="/web/stove/1">One</a>'
+        '<ul><li><a href="/web/stove/1/details">Details</a></li></ul></li>'
+        '<li><a href="/web/stove/2">Two</a></li></ul>'
+    ),
+    "empty list": '<ul id="stoveList"></ul><a href="/web/logout">Logout</a>',
+    "login page": '<form action="/web/login"><input name="email"><input name="password"></form>',
+}
+
+
+def parse_streaming(page, chunk_size):
+    parser = StoveListParser()
+    for start in range(0, len(page), chunk_size):
+        parser.feed(page[start:start + chunk_size])
+        if parser.done:
+            break
+    return parser.stoves, parser.found
+
+
+@pytest.mark.parametrize("name", PAGES)
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 100000])
+def test_streaming_parser_matches_bs4(name, chunk_size):
+    page = PAGES[name]
+    stoves, found = parse_streaming(page, chunk_size)
+    assert stoves == parse_stove_list_bs4(page.encode())
+    assert found == ('id="stoveList"' in page)
+
+
+def test_summary_layout():
+    assert parse_streaming(PAGES["summary layout"], 64)[0] == [
+        ("12345678", "Salon & Cuisine\nrunning"),
+        ("87654321", "Bureau étage"),
+    ]
+
+
+def run(test, fake):
+    """Run test(coordinator) in a Home Assistant instance, the coordinator talking to fake (a FakeFirenet)."""
+
+    async def async_run():
+        runner, base_url = await fake.start()
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(config_dir)
+            coordinator = RikaFirenetCoordinator(hass, "user", "password", 21, 15, base_url=base_url)
+            try:
+                await test(coordinator)
+            finally:
+                await coordinator.async_shutdown()
+                await hass.async_stop(force=True)
+                await runner.cleanup()
+
+    asyncio.run(async_run())
+
+
+def test_expired_session_logs_in_again():
+    fake = FakeFirenet(stoves=2)
+
+    async def test(coordinator):
+        assert await coordinator.discover_stoves() == [("10000", "Stove 1"), ("10001", "Stove 2")]
+        # Expired on the server while the cookie is still alive: the summary redirects to the login page
+        fake._sessions.clear()
+        assert await coordinator.discover_stoves() == [("10000", "Stove 1"), ("10001", "Stove 2")]
+        assert fake.stats["login"]["requests"] == 2
+
+    run(test, fake)
+
+
+def test_added_stove_available_at_once():
+    fake = FakeFirenet(stoves=1)
+
+    async def test(coordinator):
+        coordinator._stoves = await coordinator.setup_stoves()
+        await coordinator.async_refresh()
+        fake.stoves["10001"] = FakeStove("10001", "Stove 2")
+        added, removed = await coordinator.async_rediscover_stoves()
+        assert ([stove.get_id() for stove in added], removed) == (["10001"], [])
+        assert set(coordinator.data) == {"10000", "10001"}
+        assert coordinator.data["10001"] == added[0].get_state()
+
+    run(test, fake)
+
+
+def test_stove_removed_once_missing_from_consecutive_checks():
+    fake = FakeFirenet(stoves=2)
+
+    async def test(coordinator):
+        coordinator._stoves = await coordinator.setup_stoves()
+        await coordinator.async_refresh()
+        stove = fake.stoves.pop("10001")
+        for _ in range(DISCOVERY_MISSES_BEFORE_REMOVAL - 1):
+            assert await coordinator.async_rediscover_stoves() == ([], [])
+        # Back in the list: the misses are counted from zero again
+        fake.stoves["10001"] = stove
+        assert await coordinator.async_rediscover_stoves() == ([], [])
+        del fake.stoves["10001"]
+        for _ in range(DISCOVERY_MISSES_BEFORE_REMOVAL - 1):
+            assert await coordinator.async_rediscover_stoves() == ([], [])
+        assert len(coordinator.get_stoves()) == 2
+        assert await coordinator.async_rediscover_stoves() == ([], ["10001"])
+        assert [stove.get_id() for stove in coordinator.get_stoves()] == ["10000"]
+        assert set(coordinator.data) == {"10000"}
+
+    run(test, fake)
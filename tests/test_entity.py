@@ -0,0 +1,96 @@
+"""State writes of the Rika Firenet entities, skipped when the snapshot fields they read did not change."""
+import asyncio
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pytest  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.rika_firenet.core import (  # noqa: E402
+    GETTER_FIELDS,
+    SNAPSHOT_FIELDS,
+    RikaFirenetCoordinator,
+    RikaFirenetStove,
+)
+from custom_components.rika_firenet.sensor import RikaFirenetStoveSensor  # noqa: E402
+
+# Raw payload values, valid or not for the fields they end up in
+VALUES = [None, 0, 1, 2, 3, 4, 5, 6, 12, 16, 20, 21, 299, 320, 400, 32768, "2", "21.5", True, False, "x"]
+
+
+def random_payload(rng):
+    payload = {"controls": {}, "sensors": {}, "stoveFeatures": {}}
+    for section, key, _, _ in SNAPSHOT_FIELDS.values():
+        (payload if section is None else payload[section])[key] = rng.choice(VALUES)
+    return payload
+
+
+def copy_field(source, target, name):
+    section, key, _, _ = SNAPSHOT_FIELDS[name]
+    (target if section is None else target[section])[key] = (source if section is None else source[section])[key]
+
+
+@pytest.mark.parametrize("getter", sorted(GETTER_FIELDS))
+def test_getter_only_reads_its_fields(getter):
+    """A state write is skipped when none of the getter's fields changed: no other field may change its value."""
+    rng = random.Random(getter)
+    stove = RikaFirenetStove(None, "10000", "Stove 1")
+    other_stove = RikaFirenetStove(None, "10001", "Stove 2")
+    for _ in range(200):
+        payload = random_payload(rng)
+        other_payload = random_payload(rng)
+        for name in GETTER_FIELDS[getter]:
+            copy_field(payload, other_payload, name)
+        stove.update_internal_state(payload)
+        other_stove.update_internal_state(other_payload)
+        assert getattr(stove, getter)() == getattr(other_stove, getter)(), (payload, other_payload)
+
+
+def test_entity_written_only_when_its_fields_change():
+    payload = {
+        "lastSeenMinutes": 0,
+        "controls": {"onOff": True, "heatingPower": 45},
+        "sensors": {"inputRoomTemperature": "18.1", "statusMainState": 4, "statusSubState": 1},
+    }
+
+    async def async_test():
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(config_dir)
+            coordinator = RikaFirenetCoordinator(hass, "user", "password", 21, 15, base_url="http://localhost:1")
+            stove = RikaFirenetStove(coordinator, "10000", "Stove 1")
+            coordinator._stoves = [stove]
+            writes = []
+            sensors = [RikaFirenetStoveSensor(None, stove, coordinator, name) for name in ("room temperature", "main state")]
+            for sensor in sensors:
+                sensor.async_write_ha_state = lambda name=sensor.name: writes.append(name)
+
+            def poll(changes=None, data=True):
+                sensors_payload = {**payload["sensors"], **(changes or {})}
+                stove.update_internal_state({**payload, "sensors": sensors_payload})
+                coordinator.data = {"10000": stove.get_state()} if data else {}
+                coordinator.async_update_listeners()
+                writes.clear()
+                for sensor in sensors:
+                    sensor._handle_coordinator_update()
+                return sorted(writes)
+
+            try:
+                assert poll() == ["Stove 1 main state", "Stove 1 room temperature"]
+                assert poll() == []
+                assert poll({"inputRoomTemperature": "18.5"}) == ["Stove 1 room temperature"]
+                assert poll({"inputRoomTemperature": "18.5", "statusMainState": 2}) == ["Stove 1 main state"]
+                # Same values, written as strings by Firenet
+                assert poll({"inputRoomTemperature": "18.5", "statusMainState": "2"}) == []
+                # Unavailable: every entity is written
+                assert poll({"inputRoomTemperature": "18.5", "statusMainState": "2"}, data=False) == [
+                    "Stove 1 main state", "Stove 1 room temperature",
+                ]
+            finally:
+                await coordinator.async_shutdown()
+                await hass.async_stop(force=True)
+
+    asyncio.run(async_test())
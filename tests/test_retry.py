@@ -0,0 +1,66 @@
+"""Budgets, backoff and jitter of RetryScheduler."""
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pytest  # noqa: E402
+
+from custom_components.rika_firenet.retry import RetryScheduler  # noqa: E402
+
+
+def run(test):
+    """Run test(scheduler, delays) without waiting, delays collecting the retry delays."""
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    async def async_run():
+        with patch("custom_components.rika_firenet.retry.asyncio.sleep", sleep):
+            await test(RetryScheduler(base_delay=2, max_delay=30, budget=2), delays)
+
+    asyncio.run(async_run())
+
+
+@pytest.mark.parametrize("attempt, delay", [(0, 2), (1, 4), (2, 8), (3, 16), (4, 30), (10, 30)])
+def test_delay_within_equal_jitter_bounds(attempt, delay):
+    scheduler = RetryScheduler(base_delay=2, max_delay=30, budget=2)
+    delays = [scheduler.get_delay(attempt) for _ in range(1000)]
+    assert all(delay / 2 <= value <= delay for value in delays)
+    # Jittered, not fixed
+    assert len(set(delays)) > 1
+
+
+def test_budget_per_key_and_cycle():
+    async def test(scheduler, delays):
+        scheduler.start_cycle()
+        assert await scheduler.async_wait("10000", 0)
+        assert await scheduler.async_wait("10000", 1)
+        assert not await scheduler.async_wait("10000", 2)
+        # Other stoves have their own budget
+        assert await scheduler.async_wait("10001", 0)
+        assert (scheduler.get_retry_count("10000"), scheduler.get_skipped_count("10000")) == (2, 1)
+        assert scheduler.get_retry_count() == 3
+
+        scheduler.start_cycle()
+        assert await scheduler.async_wait("10000", 0)
+        assert len(delays) == 4
+
+    run(test)
+
+
+def test_no_retry_past_the_cycle_deadline():
+    async def test(scheduler, delays):
+        scheduler.start_cycle(time.monotonic() + 0.5)
+        assert not await scheduler.async_wait("10000", 0)
+        assert scheduler.get_skipped_count("10000") == 1
+        assert delays == []
+
+        scheduler.end_cycle()
+        assert await scheduler.async_wait("10000", 0)
+
+    run(test)
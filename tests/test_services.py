@@ -0,0 +1,54 @@
+"""Validation of the set_controls service data."""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pytest  # noqa: E402
+import voluptuous as vol  # noqa: E402
+
+from custom_components.rika_firenet.climate import MAX_TEMP, MIN_TEMP  # noqa: E402
+from custom_components.rika_firenet.number import NUMBER_CONFIG  # noqa: E402
+from custom_components.rika_firenet.services import NUMBER_FIELDS, SET_CONTROLS_SCHEMA  # noqa: E402
+
+
+@pytest.mark.parametrize("data", [
+    {},
+    {"device_id": "abc"},
+])
+def test_rejects_data_without_a_control(data):
+    with pytest.raises(vol.Invalid):
+        SET_CONTROLS_SCHEMA(data)
+
+
+@pytest.mark.parametrize("field", sorted(NUMBER_FIELDS))
+def test_rejects_numbers_out_of_range(field):
+    config = NUMBER_CONFIG[NUMBER_FIELDS[field]]
+    for value in (config["min"] - 1, config["max"] + 1, "x"):
+        with pytest.raises(vol.Invalid):
+            SET_CONTROLS_SCHEMA({"device_id": "abc", field: value})
+    assert SET_CONTROLS_SCHEMA({"device_id": "abc", field: config["min"]})[field] == config["min"]
+    assert SET_CONTROLS_SCHEMA({"device_id": "abc", field: str(config["max"])})[field] == config["max"]
+
+
+@pytest.mark.parametrize("value", [3, -1, "eco", None])
+def test_rejects_unknown_operating_modes(value):
+    with pytest.raises(vol.Invalid):
+        SET_CONTROLS_SCHEMA({"device_id": "abc", "operating_mode": value})
+
+
+@pytest.mark.parametrize("value", [MIN_TEMP - 0.5, MAX_TEMP + 0.5, "warm"])
+def test_rejects_target_temperatures_out_of_range(value):
+    with pytest.raises(vol.Invalid):
+        SET_CONTROLS_SCHEMA({"device_id": "abc", "target_temperature": value})
+
+
+def test_rejects_unknown_fields():
+    with pytest.raises(vol.Invalid):
+        SET_CONTROLS_SCHEMA({"device_id": "abc", "on_off": True, "heating_power_level": 50})
+
+
+def test_accepts_controls():
+    assert SET_CONTROLS_SCHEMA({
+        "device_id": "abc", "on_off": "off", "operating_mode": "2", "target_temperature": MAX_TEMP, "heating_power": 50,
+    }) == {"device_id": ["abc"], "on_off": False, "operating_mode": 2, "target_temperature": MAX_TEMP, "heating_power": 50}
@@ -0,0 +1,179 @@
+"""Status text and picture of RikaFirenetStove.
+
+Checked against the rules as they were evaluated before the status lookup table, on the stove getters
+reading the raw payload.
+"""
+import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pytest  # noqa: E402
+
+from custom_components.rika_firenet.core import RikaFirenetStove  # noqa: E402
+
+
+class _PayloadStove:
+    """The getters the status rules used to read, as they were before the payload snapshot."""
+
+    def __init__(self, state):
+        self._state = state
+
+    def _get_int(self, section, key):
+        if self._state and section in self._state and key in self._state[section]:
+            try:
+                return int(self._state[section][key])
+            except (ValueError, TypeError):
+                return None
+        return None
+
+    def get_last_seen_minutes(self):
+        if self._state and 'lastSeenMinutes' in self._state:
+            try:
+                return int(self._state['lastSeenMinutes'])
+            except (ValueError, TypeError):
+                return 99
+        return 99
+
+    def is_frost_protection_started(self):
+        return bool(self._state.get('sensors', {}).get('statusFrostStarted', False)) if self._state else False
+
+    def is_stove_eco_mode(self):
+        return bool(self._state.get('controls', {}).get('ecoMode')) if self._state else False
+
+    def get_stove_temperature(self):
+        return self._get_int('sensors', 'inputFlameTemperature')
+
+    def get_main_state(self):
+        return self._get_int('sensors', 'statusMainState')
+
+    def get_sub_state(self):
+        return self._get_int('sensors', 'statusSubState')
+
+    def get_status_error(self):
+        return self._get_int('sensors', 'statusError')
+
+    def get_status_sub_error(self):
+        return self._get_int('sensors', 'statusSubError')
+
+    def get_status_warning(self):
+        return self._get_int('sensors', 'statusWarning')
+
+
+PREVIOUS_STATUS_RULES = [
+    (lambda s: s.get_last_seen_minutes() > 2,
+     lambda s: ["https://www.rika-firenet.com/images/status/Warning_WifiSignal.svg", "offline"]),
+    (lambda s: s.get_status_warning() == 2,
+     lambda s: ["https://www.rika-firenet.com/images/status/Any_Warning.svg", "pellet_lid_open"]),
+    (lambda s: s.get_status_error() == 1 and s.get_status_sub_error() == 1,
+     lambda s: ["https://raw.githubusercontent.com/antibill51/rika-firenet-custom-component/main/images/status/Visu_Error.svg", "Error"]),
+    (lambda s: s.get_status_error() == 1 and s.get_status_sub_error() == 2,
+     lambda s: ["https://raw.githubusercontent.com/antibill51/rika-firenet-custom-component/main/images/status/Visu_Empty.svg", "empty_tank"]),
+    (lambda s: s.get_status_error() == 8 and s.get_status_sub_error() == 16,
+     lambda s: ["https://raw.githubusercontent.com/antibill51/rika-firenet-custom-component/main/images/status/Visu_Error.svg", "not_ignited"]),
+    (lambda s: s.get_status_error() == 1,
+     lambda s: ["/", "statusSubError" + str(s.get_status_sub_error())]),
+    (lambda s: s.get_status_error() == 32768,
+     lambda s: ["https://raw.githubusercontent.com/antibill51/rika-firenet-custom-component/main/images/status/Visu_smoke_fan.svg", "smoke_fan"]),
+    (lambda s: s.is_frost_protection_started(),
+     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Freeze.svg", "frost_protection"]),
+    (lambda s: s.get_main_state() == 1 and s.get_sub_state() == 0,
+     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Off.svg", "stove_off"]),
+    (lambda s: s.get_main_state() == 1 and s.get_sub_state() in [1, 2, 3],
+     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Standby.svg", "external_request" if s.get_sub_state() == 2 else "standby"]),
+    (lambda s: s.get_main_state() == 1,
+     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Off.svg", "sub_state_unknown"]),
+    (lambda s: s.get_main_state() == 2,
+     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Ignition.svg", "ignition_on"]),
+    (lambda s: s.get_main_state() == 3,
+     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Ignition.svg", "starting_up"]),
+    (lambda s: s.get_main_state() == 4,
+     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Control.svg", "running"]),
+    (lambda s: s.get_main_state() == 5 and s.get_sub_state() in [3, 4],
+     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Clean.svg", "big_clean"]),
+    (lambda s: s.get_main_state() == 5,
+     lambda s: ["https://www.rika-firenet.com/images/status/Visu_Clean.svg", "clean"]),
+    (lambda s: s.get_main_state() == 6,
+     lambda s: ["https://www.rika-firenet.com/images/status/Visu_BurnOff.svg", "burn_off"]),
+    (lambda s: s.get_main_state() in [11, 13, 14, 16, 17, 50],
+     lambda s: ["https://www.rika-firenet.com/images/status/Visu_SpliLog.svg", "split_log_check"]),
+    (lambda s: s.get_main_state() == 21 and s.get_sub_state() == 12 and s.get_stove_temperature() is not None and 300 <= s.get_stove_temperature() <= 350,
+     lambda s: ["https://www.rika-firenet.com/images/status/Visu_SpliLog.svg", "split_log_refuel"]),
+    (lambda s: s.get_main_state() == 21 and s.get_sub_state() == 12 and s.get_stove_temperature() is not None and s.get_stove_temperature() < 300,
+     lambda s: ["https://www.rika-firenet.com/images/status/Visu_SpliLog.svg", "split_log_stop_refuel"]),
+    (lambda s: s.get_main_state() == 20 and s.is_stove_eco_mode(),
+     lambda s: ["https://www.rika-firenet.com/images/status/Visu_SpliLog.svg", "split_log_ecomode"]),
+    (lambda s: s.get_main_state() in [20, 21],
+     lambda s: ["https://www.rika-firenet.com/images/status/Visu_SpliLog.svg", "split_log_mode"]),
+]
+
+
+def previous_status(state):
+    if not state:
+        return ("https://www.rika-firenet.com/images/status/Warning_WifiSignal.svg", "unavailable")
+    stove = _PayloadStove(state)
+    for condition, result_func in PREVIOUS_STATUS_RULES:
+        if condition(stove):
+            return tuple(result_func(stove))
+    return ("https://www.rika-firenet.com/images/status/Visu_Off.svg", "unknown")
+
+
+MAIN_STATES = [None, 0, 1, 2, 3, 4, 5, 6, 11, 13, 14, 16, 17, 20, 21, 50, 99, "4", "x"]
+SUB_STATES = [None, 0, 1, 2, 3, 4, 12, "12"]
+ERRORS = [None, 0, 1, 8, 32768, "1"]
+SUB_ERRORS = [None, 0, 1, 2, 16, 7]
+WARNINGS = [None, 0, 2, "2"]
+FROST_STARTED = [None, False, True]
+LAST_SEEN_MINUTES = [None, 0, 2, 3, "1"]
+FLAME_TEMPERATURES = [None, 299, 300, 350, 351, "320", "x"]
+ECO_MODES = [None, False, True]
+
+
+def make_state(
+    main_state=4, sub_state=1, error=0, sub_error=0, warning=0, frost_started=False, last_seen=0,
+    flame_temperature=100, eco_mode=False,
+):
+    return {
+        "lastSeenMinutes": last_seen,
+        "controls": {"ecoMode": eco_mode},
+        "sensors": {
+            "statusMainState": main_state,
+            "statusSubState": sub_state,
+            "statusError": error,
+            "statusSubError": sub_error,
+            "statusWarning": warning,
+            "statusFrostStarted": frost_started,
+            "inputFlameTemperature": flame_temperature,
+        },
+    }
+
+
+def assert_previous_status(states):
+    stove = RikaFirenetStove(None, "10000", "Stove 1")
+    for state in states:
+        stove.update_internal_state(state)
+        assert (stove.get_status_picture(), stove.get_status_text()) == previous_status(state), state
+
+
+@pytest.mark.parametrize("error", ERRORS)
+def test_errors_and_warnings_match_the_previous_rules(error):
+    assert_previous_status(
+        make_state(main_state, sub_state, error, sub_error, warning, frost_started, last_seen)
+        for sub_error, warning, frost_started, last_seen, main_state, sub_state in itertools.product(
+            SUB_ERRORS, WARNINGS, FROST_STARTED, LAST_SEEN_MINUTES, [None, 1, 4, 21], [0, 12]
+        )
+    )
+
+
+@pytest.mark.parametrize("main_state", MAIN_STATES)
+def test_main_states_match_the_previous_rules(main_state):
+    assert_previous_status(
+        make_state(main_state, sub_state, flame_temperature=flame_temperature, eco_mode=eco_mode)
+        for sub_state, flame_temperature, eco_mode in itertools.product(SUB_STATES, FLAME_TEMPERATURES, ECO_MODES)
+    )
+
+
+def test_status_without_payload():
+    stove = RikaFirenetStove(None, "10000", "Stove 1")
+    assert stove.get_status() == previous_status(None)
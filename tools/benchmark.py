@@ -0,0 +1,228 @@
+"""Benchmark the coordinator poll cycle against the local Firenet stand-in.
+
+Runs RikaFirenetCoordinator.update(), async_update_data() and
+set_stove_controls() against tools/fake_firenet.py for several stove counts
+and latency/failure profiles, and reports per operation:
+
+- p50 / p95 wall clock time
+- HTTP requests per cycle, bytes received and server errors
+- time spent in executor threads
+
+Needs a Home Assistant development environment (homeassistant installed):
+
+    python tools/benchmark.py --stoves 1 5 50 --cycles 20
+    python tools/benchmark.py --output baseline.json
+    python tools/benchmark.py --baseline baseline.json --tolerance 0.2
+
+With --baseline the script exits with status 1 when a p95 time or the number
+of requests per cycle regresses by more than the tolerance.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.rika_firenet.core import RikaFirenetCoordinator  # noqa: E402
+from fake_firenet import FakeFirenet  # noqa: E402
+
+# Latency and failure profiles passed to FakeFirenet
+PROFILES = {
+    "fast": {"latency": 0.01},
+    "cloud": {"latency": 0.15, "jitter": 0.25},
+    "flaky": {"latency": 0.15, "jitter": 0.25, "error_rate": 0.1},
+    "degraded": {"latency": 0.5, "jitter": 1.0, "error_rate": 0.3},
+}
+
+
+def percentile(values, percent):
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+class ExecutorTimer:
+    """Wrap hass.async_add_executor_job to add up the time spent in executor threads."""
+
+    def __init__(self, hass):
+        self.seconds = 0.0
+        self._original = hass.async_add_executor_job
+        hass.async_add_executor_job = self._async_add_executor_job
+
+    def _async_add_executor_job(self, target, *args):
+        def run():
+            start = time.perf_counter()
+            try:
+                return target(*args)
+            finally:
+                self.seconds += time.perf_counter() - start
+
+        return self._original(run)
+
+
+class Measurement:
+    def __init__(self, fake, executor_timer):
+        self._fake = fake
+        self._executor_timer = executor_timer
+        self.durations = []
+        self.requests = []
+        self.bytes = []
+        self.errors = []
+        self.executor = []
+
+    async def run(self, coro):
+        stats_before = self._snapshot()
+        executor_before = self._executor_timer.seconds
+        start = time.perf_counter()
+        await coro
+        self.durations.append(time.perf_counter() - start)
+        self.executor.append(self._executor_timer.seconds - executor_before)
+        stats_after = self._snapshot()
+        self.requests.append(stats_after[0] - stats_before[0])
+        self.bytes.append(stats_after[1] - stats_before[1])
+        self.errors.append(stats_after[2] - stats_before[2])
+
+    def _snapshot(self):
+        stats = self._fake.stats.values()
+        return (
+            sum(endpoint["requests"] for endpoint in stats),
+            sum(endpoint["bytes"] for endpoint in stats),
+            sum(endpoint["errors"] for endpoint in stats),
+        )
+
+    def summary(self):
+        return {
+            "p50_s": round(percentile(self.durations, 50), 4),
+            "p95_s": round(percentile(self.durations, 95), 4),
+            "requests_per_cycle": round(statistics.mean(self.requests), 2) if self.requests else 0,
+            "bytes_per_cycle": round(statistics.mean(self.bytes)) if self.bytes else 0,
+            "errors": sum(self.errors),
+            "executor_s": round(sum(self.executor), 4),
+        }
+
+
+async def run_scenario(stove_count, profile, cycles):
+    fake = FakeFirenet(stoves=stove_count, seed=42, **PROFILES[profile])
+    runner, base_url = await fake.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        executor_timer = ExecutorTimer(hass)
+        coordinator = RikaFirenetCoordinator(hass, "bench", "bench", 21, 15, base_url=base_url)
+        try:
+            await coordinator.setup()
+
+            update = Measurement(fake, executor_timer)
+            for _ in range(cycles):
+                # Defeat the short-lived status cache so each cycle hits the backend
+                coordinator._status_cache.clear()
+                await update.run(coordinator.update())
+
+            update_data = Measurement(fake, executor_timer)
+            for _ in range(cycles):
+                coordinator._status_cache.clear()
+                await update_data.run(coordinator.async_update_data())
+
+            controls = Measurement(fake, executor_timer)
+            stove = coordinator.get_stoves()[0]
+            for index in range(cycles):
+                stove_controls = dict(stove.get_control_state())
+                stove_controls["heatingPower"] = 30 + (index % 15) * 5
+                await controls.run(_async_write(coordinator, stove, stove_controls))
+        finally:
+            await coordinator.async_shutdown()
+            await hass.async_stop(force=True)
+            await runner.cleanup()
+
+    return {
+        "update": update.summary(),
+        "async_update_data": update_data.summary(),
+        "set_stove_controls": controls.summary(),
+    }
+
+
+async def _async_write(coordinator, stove, controls):
+    new_state = await coordinator.set_stove_controls(stove.get_id(), controls)
+    if new_state:
+        # Keep the revision current for the next write
+        stove.update_internal_state(new_state)
+
+
+def compare(results, baseline, tolerance):
+    """Return the list of regressions beyond tolerance."""
+    regressions = []
+    for scenario, operations in results.items():
+        for operation, metrics in operations.items():
+            reference = baseline.get(scenario, {}).get(operation)
+            if not reference:
+                continue
+            for metric in ("p95_s", "requests_per_cycle"):
+                if reference[metric] and metrics[metric] > reference[metric] * (1 + tolerance):
+                    regressions.append(
+                        f"{scenario} {operation} {metric}: {metrics[metric]} > {reference[metric]} (+{tolerance:.0%})"
+                    )
+    return regressions
+
+
+def print_table(results):
+    header = f"{'scenario':<16}{'operation':<20}{'p50 s':>9}{'p95 s':>9}{'req/cycle':>11}{'bytes/cycle':>13}{'errors':>8}{'executor s':>12}"
+    print(header)
+    print("-" * len(header))
+    for scenario, operations in results.items():
+        for operation, metrics in operations.items():
+            print(
+                f"{scenario:<16}{operation:<20}{metrics['p50_s']:>9}{metrics['p95_s']:>9}"
+                f"{metrics['requests_per_cycle']:>11}{metrics['bytes_per_cycle']:>13}"
+                f"{metrics['errors']:>8}{metrics['executor_s']:>12}"
+            )
+
+
+async def async_main(args):
+    results = {}
+    for profile in args.profiles:
+        for stove_count in args.stoves:
+            scenario = f"{profile}/{stove_count}"
+            print(f"Running {scenario}...", file=sys.stderr)
+            results[scenario] = await run_scenario(stove_count, profile, args.cycles)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stoves", type=int, nargs="+", default=[1, 5, 50])
+    parser.add_argument("--profiles", nargs="+", choices=sorted(PROFILES), default=["fast", "cloud", "flaky"])
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--output", help="write the results as JSON, e.g. to record a baseline")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed regression ratio (default 0.2)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    results = asyncio.run(async_main(args))
+    print_table(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""Local stand-in for rika-firenet.com.
+
+Implements the endpoints used by the integration (login, summary page,
+status and controls with revision checks) so the coordinator can be run,
+measured and regression-tested without network access.
+
+Run it standalone:
+
+    python tools/fake_firenet.py --stoves 3 --latency 0.2 --error-rate 0.05
+
+then point a coordinator at it with base_url="http://localhost:8080".
+It can also be embedded in a script, see tools/benchmark.py.
+"""
+import argparse
+import asyncio
+import copy
+import logging
+import random
+import secrets
+import time
+
+from aiohttp import web
+
+_LOGGER = logging.getLogger(__name__)
+
+SESSION_COOKIE = "connect.sid"
+
+# Status payload as documented in info.md
+STOVE_TEMPLATE = {
+    "lastSeenMinutes": 0,
+    "controls": {
+        "onOff": True,
+        "operatingMode": 0,
+        "heatingPower": 45,
+        "targetTemperature": "21",
+        "bakeTemperature": "180",
+        "ecoMode": False,
+        "heatingTimesActiveForComfort": False,
+        "setBackTemperature": "12",
+        "convectionFan1Active": False,
+        "convectionFan1Level": 0,
+        "convectionFan1Area": 0,
+        "convectionFan2Active": True,
+        "convectionFan2Level": 2,
+        "convectionFan2Area": 0,
+        "frostProtectionActive": False,
+        "frostProtectionTemperature": "4",
+        "temperatureOffset": "0",
+        "RoomPowerRequest": 2,
+    },
+    "sensors": {
+        "inputRoomTemperature": "18.1",
+        "inputFlameTemperature": 100,
+        "inputBakeTemperature": "1024",
+        "statusError": 0,
+        "statusSubError": 0,
+        "statusWarning": 0,
+        "statusService": 0,
+        "outputDischargeMotor": 360,
+        "outputDischargeCurrent": 31,
+        "outputIDFan": 1400,
+        "outputIDFanTarget": 1400,
+        "outputAirFlaps": 0,
+        "outputAirFlapsTargetPosition": 0,
+        "inputBoardTemperature": "2.7",
+        "statusMainState": 4,
+        "statusSubState": 1,
+        "statusWifiStrength": -67,
+        "parameterRuntimePellets": 5024,
+        "parameterRuntimeLogs": 0,
+        "parameterFeedRateTotal": 4500,
+        "parameterFeedRateService": 978,
+        "parameterIgnitionCount": 2087,
+        "parameterOnOffCycleCount": 197,
+        "statusHeatingTimesNotProgrammed": True,
+        "statusFrostStarted": False,
+    },
+    "stoveType": "DOMO MultiAir",
+    "stoveFeatures": {
+        "multiAir1": True,
+        "multiAir2": True,
+        "insertionMotor": False,
+        "airFlaps": False,
+        "logRuntime": False,
+        "bakeMode": False,
+    },
+    "oem": "RIKA",
+}
+
+
+class FakeStove:
+    """One simulated stove: status payload, revision and a crude main state cycle."""
+
+    IGNITION_SECONDS = 60
+
+    def __init__(self, stove_id, name):
+        self.stove_id = stove_id
+        self.payload = copy.deepcopy(STOVE_TEMPLATE)
+        self.payload["name"] = name
+        self.payload["stoveID"] = stove_id
+        self._ignition_started = None
+        self.set_revision(int(time.time()))
+
+    @property
+    def revision(self):
+        return self.payload["controls"]["revision"]
+
+    def set_revision(self, revision):
+        self.payload["controls"]["revision"] = revision
+        self.payload["lastConfirmedRevision"] = revision
+
+    def apply_controls(self, controls):
+        was_on = self.payload["controls"]["onOff"]
+        self.payload["controls"].update(controls)
+        self.set_revision(self.revision + 1)
+        is_on = self.payload["controls"]["onOff"]
+        if is_on and not was_on:
+            self._ignition_started = time.monotonic()
+        elif was_on and not is_on:
+            self._ignition_started = None
+            self._set_main_state(1, 0)
+
+    def get_status(self):
+        if self._ignition_started is not None:
+            if time.monotonic() - self._ignition_started < self.IGNITION_SECONDS:
+                self._set_main_state(2, 0)
+            else:
+                self._ignition_started = None
+                self._set_main_state(4, 1)
+        return self.payload
+
+    def _set_main_state(self, main_state, sub_state):
+        self.payload["sensors"]["statusMainState"] = main_state
+        self.payload["sensors"]["statusSubState"] = sub_state
+
+
+class FakeFirenet:
+    """aiohttp application mimicking the Firenet endpoints.
+
+    latency: fixed delay added to every request (seconds)
+    jitter: random extra delay, up to this many seconds
+    error_rate: probability of answering a request with HTTP 500
+    timeout_rate: probability of not answering within hang_time seconds
+    cookie_ttl: lifetime of a session; expired sessions get 401 / a login redirect
+    """
+
+    def __init__(
+        self,
+        stoves=1,
+        username=None,
+        password=None,
+        latency=0.0,
+        jitter=0.0,
+        error_rate=0.0,
+        timeout_rate=0.0,
+        hang_time=30.0,
+        cookie_ttl=3600,
+        seed=None,
+    ):
+        self.username = username
+        self.password = password
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.hang_time = hang_time
+        self.cookie_ttl = cookie_ttl
+        self._random = random.Random(seed)
+        self._sessions: dict[str, float] = {}
+        self.stoves = {
+            str(10000 + index): FakeStove(str(10000 + index), f"Stove {index + 1}")
+            for index in range(stoves)
+        }
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Per endpoint counters: requests, errors, bytes sent."""
+        self.stats = {
+            endpoint: {"requests": 0, "errors": 0, "bytes": 0}
+            for endpoint in ("login", "summary", "status", "controls")
+        }
+
+    def create_app(self):
+        app = web.Application()
+        app.router.add_get("/web/login", self._handle_login_page)
+        app.router.add_post("/web/login", self._handle_login)
+        app.router.add_get("/web/summary", self._handle_summary)
+        app.router.add_get("/api/client/{stove_id}/status", self._handle_status)
+        app.router.add_post("/api/client/{stove_id}/controls", self._handle_controls)
+        app.router.add_get("/_stats", self._handle_stats)
+        app.router.add_delete("/_stats", self._handle_reset_stats)
+        return app
+
+    async def start(self, host="localhost", port=0):
+        """Serve on host:port (0 picks a free port) and return (runner, base_url).
+
+        Use a host name rather than an IP address: aiohttp's cookie jar
+        ignores cookies set by IP addresses.
+        """
+        runner = web.AppRunner(self.create_app())
+        await runner.setup()
+        site = web.TCPSite(runner, host, port)
+        await site.start()
+        port = runner.addresses[0][1]
+        return runner, f"http://{host}:{port}"
+
+    async def _simulate_network(self, endpoint):
+        self.stats[endpoint]["requests"] += 1
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if self._random.random() < self.timeout_rate:
+            delay += self.hang_time
+        if delay:
+            await asyncio.sleep(delay)
+        if self._random.random() < self.error_rate:
+            self.stats[endpoint]["errors"] += 1
+            raise web.HTTPInternalServerError()
+
+    def _has_session(self, request):
+        session = request.cookies.get(SESSION_COOKIE)
+        expires = self._sessions.get(session)
+        if expires is None:
+            return False
+        if expires <= time.time():
+            del self._sessions[session]
+            return False
+        return True
+
+    def _respond(self, endpoint, response):
+        if response.body is not None:
+            self.stats[endpoint]["bytes"] += len(response.body)
+        return response
+
+    async def _handle_login_page(self, request):
+        return web.Response(text='<form action="/web/login"></form>', content_type="text/html")
+
+    async def _handle_login(self, request):
+        await self._simulate_network("login")
+        form = await request.post()
+        if (self.username is not None and form.get("email") != self.username) or (
+            self.password is not None and form.get("password") != self.password
+        ):
+            return self._respond("login", await self._handle_login_page(request))
+        session = secrets.token_hex(16)
+        self._sessions[session] = time.time() + self.cookie_ttl
+        response = web.Response(text='<a href="/web/logout">Logout</a>', content_type="text/html")
+        response.set_cookie(SESSION_COOKIE, session, max_age=self.cookie_ttl, path="/", httponly=True)
+        return self._respond("login", response)
+
+    async def _handle_summary(self, request):
+        await self._simulate_network("summary")
+        if not self._has_session(request):
+            raise web.HTTPFound("/web/login")
+        items = "".join(
+            f'<li><a href="/web/stove/{stove.stove_id}">{stove.payload["name"]}</a></li>'
+            for stove in self.stoves.values()
+        )
+        html = f'<html><body><ul id="stoveList">{items}</ul><a href="/web/logout">Logout</a></body></html>'
+        return self._respond("summary", web.Response(text=html, content_type="text/html"))
+
+    def _get_stove(self, request):
+        stove = self.stoves.get(request.match_info["stove_id"])
+        if stove is None:
+            raise web.HTTPNotFound()
+        return stove
+
+    async def _handle_status(self, request):
+        await self._simulate_network("status")
+        if not self._has_session(request):
+            raise web.HTTPUnauthorized()
+        stove = self._get_stove(request)
+        return self._respond("status", web.json_response(stove.get_status()))
+
+    async def _handle_controls(self, request):
+        await self._simulate_network("controls")
+        if not self._has_session(request):
+            raise web.HTTPUnauthorized()
+        stove = self._get_stove(request)
+        controls = await request.json()
+        if controls.get("revision") != stove.revision:
+            return self._respond("controls", web.Response(text="Revision mismatch", status=409))
+        stove.apply_controls({key: value for key, value in controls.items() if key != "revision"})
+        return self._respond("controls", web.Response(text="OK"))
+
+    async def _handle_stats(self, request):
+        return web.json_response(self.stats)
+
+    async def _handle_reset_stats(self, request):
+        self.reset_stats()
+        return web.json_response(self.stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for rika-firenet.com")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--stoves", type=int, default=1, help="number of stoves on the account")
+    parser.add_argument("--username", help="accepted email, any if omitted")
+    parser.add_argument("--password", help="accepted password, any if omitted")
+    parser.add_argument("--latency", type=float, default=0.0, help="delay added to every request, in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra delay, in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of a HTTP 500 answer")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="probability of a request hanging")
+    parser.add_argument("--cookie-ttl", type=int, default=3600, help="session lifetime, in seconds")
+    parser.add_argument("--seed", type=int, help="random seed for reproducible failures")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    fake = FakeFirenet(
+        stoves=args.stoves,
+        username=args.username,
+        password=args.password,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        cookie_ttl=args.cookie_ttl,
+        seed=args.seed,
+    )
+    _LOGGER.info("Serving %d fake stove(s): %s", len(fake.stoves), ", ".join(fake.stoves))
+    web.run_app(fake.create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()